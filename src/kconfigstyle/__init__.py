@@ -6,6 +6,8 @@ This implementation uses a parser to build an AST, then formats by traversing th
 """
 
 import argparse
+import mmap
+import os
 import re
 import sys
 import textwrap
@@ -66,7 +68,7 @@ class LinterConfig:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class LintIssue:
     """Represents a linting issue."""
 
@@ -76,8 +78,11 @@ class LintIssue:
     message: str
 
     def __str__(self):
-        col_str = f":{self.column}" if self.column is not None else ""
-        return f"Line {self.line_number}{col_str}: [{self.severity}] {self.message}"
+        if self.column is None:
+            return f"Line {self.line_number}: [{self.severity}] {self.message}"
+        return (
+            f"Line {self.line_number}:{self.column}: [{self.severity}] {self.message}"
+        )
 
 
 # AST Node Types
@@ -198,6 +203,63 @@ class UnknownLine(ASTNode):
 class KconfigParser:
     """Parser for Kconfig files."""
 
+    # Keywords that start a new top-level block
+    _STRUCTURAL_KEYWORDS = (
+        "config ",
+        "menuconfig ",
+        "choice",
+        "endchoice",
+        "menu ",
+        "endmenu",
+        "if ",
+        "endif",
+        "source ",
+        "rsource ",
+        "osource ",
+        "orsource ",
+        "comment ",
+        "mainmenu ",
+    )
+
+    # Keywords that start an option within a config entry
+    _CONFIG_OPTION_KEYWORDS = (
+        "bool",
+        "tristate",
+        "string",
+        "int",
+        "hex",
+        "def_bool",
+        "def_tristate",
+        "prompt",
+        "default",
+        "depends on",
+        "depends",
+        "select",
+        "imply",
+        "range",
+        "option",
+        "help",
+    )
+
+    # Leading keyword of an option line -> (option type, pattern), compiled
+    # once, so each line is matched against a single pattern
+    _CONFIG_OPTION_PATTERNS = {
+        "bool": ("bool", re.compile(r"^bool(\s+(.*))?$")),
+        "tristate": ("tristate", re.compile(r"^tristate(\s+(.*))?$")),
+        "string": ("string", re.compile(r"^string(\s+(.*))?$")),
+        "int": ("int", re.compile(r"^int(\s+(.*))?$")),
+        "hex": ("hex", re.compile(r"^hex(\s+(.*))?$")),
+        "def_bool": ("def_bool", re.compile(r"^def_bool\s+(.+)$")),
+        "def_tristate": ("def_tristate", re.compile(r"^def_tristate\s+(.+)$")),
+        "prompt": ("prompt", re.compile(r"^prompt\s+(.+)$")),
+        "default": ("default", re.compile(r"^default\s+(.+)$")),
+        "depends": ("depends_on", re.compile(r"^depends\s+on\s+(.+)$")),
+        "select": ("select", re.compile(r"^select\s+(.+)$")),
+        "imply": ("imply", re.compile(r"^imply\s+(.+)$")),
+        "range": ("range", re.compile(r"^range\s+(.+)$")),
+        "option": ("option", re.compile(r"^option\s+(.+)$")),
+    }
+
     def __init__(self):
         self.lines: list[str] = []
         self.pos: int = 0
@@ -537,45 +599,11 @@ class KconfigParser:
 
     def _is_structural_keyword(self, stripped: str) -> bool:
         """Check if line starts with a structural keyword."""
-        keywords = [
-            "config ",
-            "menuconfig ",
-            "choice",
-            "endchoice",
-            "menu ",
-            "endmenu",
-            "if ",
-            "endif",
-            "source ",
-            "rsource ",
-            "osource ",
-            "orsource ",
-            "comment ",
-            "mainmenu ",
-        ]
-        return any(stripped.startswith(kw) for kw in keywords)
+        return stripped.startswith(self._STRUCTURAL_KEYWORDS)
 
     def _is_config_option_keyword(self, stripped: str) -> bool:
         """Check if line starts with a config option keyword."""
-        keywords = [
-            "bool",
-            "tristate",
-            "string",
-            "int",
-            "hex",
-            "def_bool",
-            "def_tristate",
-            "prompt",
-            "default",
-            "depends on",
-            "depends",
-            "select",
-            "imply",
-            "range",
-            "option",
-            "help",
-        ]
-        return any(stripped.startswith(kw) for kw in keywords)
+        return stripped.startswith(self._CONFIG_OPTION_KEYWORDS)
 
     def _parse_config_option(self) -> ConfigOption | None:
         """Parse a config option like 'bool', 'default', etc."""
@@ -585,26 +613,12 @@ class KconfigParser:
         # Extract inline comment
         stripped_no_comment, inline_comment = self._extract_inline_comment(stripped)
 
-        # Match option types
-        patterns = {
-            "bool": r"^bool(\s+(.*))?$",
-            "tristate": r"^tristate(\s+(.*))?$",
-            "string": r"^string(\s+(.*))?$",
-            "int": r"^int(\s+(.*))?$",
-            "hex": r"^hex(\s+(.*))?$",
-            "def_bool": r"^def_bool\s+(.+)$",
-            "def_tristate": r"^def_tristate\s+(.+)$",
-            "prompt": r"^prompt\s+(.+)$",
-            "default": r"^default\s+(.+)$",
-            "depends_on": r"^depends\s+on\s+(.+)$",
-            "select": r"^select\s+(.+)$",
-            "imply": r"^imply\s+(.+)$",
-            "range": r"^range\s+(.+)$",
-            "option": r"^option\s+(.+)$",
-        }
-
-        for opt_type, pattern in patterns.items():
-            match = re.match(pattern, stripped_no_comment)
+        words = stripped_no_comment.split(None, 1)
+        keyword = words[0] if words else ""
+        entry = self._CONFIG_OPTION_PATTERNS.get(keyword)
+        if entry is not None:
+            opt_type, pattern = entry
+            match = pattern.match(stripped_no_comment)
             if match:
                 if opt_type in ["bool", "tristate", "string", "int", "hex"]:
                     # For type definitions, group 2 contains the optional prompt
@@ -1387,6 +1401,63 @@ class KconfigFormatter:
 class KconfigLinter:
     """Linter for Kconfig files."""
 
+    # Line prefixes that end a help block during indentation checks
+    _HELP_END_PREFIXES = (
+        "#",
+        "config",
+        "menuconfig",
+        "choice",
+        "menu",
+        "if ",
+        "endif",
+        "endmenu",
+        "endchoice",
+        "source",
+        "rsource",
+        "comment ",
+        "mainmenu",
+    )
+
+    # (prefix, line type) pairs checked by the test-only _get_line_type
+    _LINE_TYPE_PREFIXES = (
+        ("config ", "config"),
+        ("#", "comment_line"),
+        ("help", "help"),
+        ("menuconfig ", "menuconfig"),
+        ("if ", "if"),
+        ("endif", "endif"),
+        ("menu ", "menu"),
+        ("endmenu", "endmenu"),
+        ("choice", "choice"),
+        ("endchoice", "endchoice"),
+        ("source ", "source"),
+        ("rsource ", "source"),
+        ("comment ", "comment"),
+    )
+
+    # Keywords that start an option line for _get_line_type (must be
+    # followed by whitespace)
+    _OPTION_KEYWORDS = frozenset(
+        {
+            "bool",
+            "tristate",
+            "string",
+            "int",
+            "hex",
+            "def_bool",
+            "def_tristate",
+            "prompt",
+            "default",
+            "select",
+            "imply",
+            "range",
+            "option",
+        }
+    )
+
+    # Config name pattern used by the test-only _check_config_name
+    _CONFIG_NAME_RE = re.compile(r"^\s*(config|menuconfig)\s+(\S+)")
+
     def __init__(self, config: LinterConfig):
         self.config = config
         self.issues: list[LintIssue] = []
@@ -1395,27 +1466,38 @@ class KconfigLinter:
 
     def lint_file(self, filepath: Path) -> list[LintIssue]:
         """Lint a Kconfig file and return list of issues."""
-        self.issues = []
-
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                content = f.read()
-                lines = content.splitlines(keepends=True)
+            content = _read_file(filepath)
         except Exception as e:
-            self.issues.append(LintIssue(0, None, "error", f"Failed to read file: {e}"))
+            self.issues = [LintIssue(0, None, "error", f"Failed to read file: {e}")]
             return self.issues
 
+        return self.lint_lines(content.splitlines(keepends=True), filepath)
+
+    def lint_lines(
+        self, lines: list[str], filepath: Path = Path("<memory>")
+    ) -> list[LintIssue]:
+        """Lint Kconfig lines (with line endings) and return list of issues."""
+        self.issues = []
+        if not lines:
+            return self.issues
+        append = self.issues.append
+
+        content = "".join(lines)
+
+        # Split every line into text/indent/content once for both passes
+        scanned = [_scan_line(line) for line in lines]
+
         # Check each line for basic issues
         empty_line_count = 0
-        for i, line in enumerate(lines, 1):
-            line_no_newline = line.rstrip("\n\r")
-
+        for i, (line_no_newline, _, stripped) in enumerate(scanned, 1):
             # Trailing whitespace
-            if line_no_newline != line_no_newline.rstrip():
-                self.issues.append(
+            trimmed_len = len(line_no_newline.rstrip())
+            if trimmed_len != len(line_no_newline):
+                append(
                     LintIssue(
                         i,
-                        len(line_no_newline.rstrip()) + 1,
+                        trimmed_len + 1,
                         "error",
                         "Trailing whitespace not allowed",
                     )
@@ -1423,7 +1505,7 @@ class KconfigLinter:
 
             # Line length
             if len(line_no_newline) > self.config.max_line_length:
-                self.issues.append(
+                append(
                     LintIssue(
                         i,
                         self.config.max_line_length + 1,
@@ -1433,10 +1515,10 @@ class KconfigLinter:
                 )
 
             # Multiple consecutive empty lines
-            if not line.strip():
+            if not stripped:
                 empty_line_count += 1
                 if self.config.consolidate_empty_lines and empty_line_count > 1:
-                    self.issues.append(
+                    append(
                         LintIssue(
                             i,
                             1,
@@ -1444,14 +1526,15 @@ class KconfigLinter:
                             "Multiple consecutive empty lines (should be consolidated to one)",
                         )
                     )
-            else:
-                empty_line_count = 0
+                # No remaining per-line checks apply to blank lines
+                continue
+
+            empty_line_count = 0
 
             # Comment spacing
-            stripped = line_no_newline.lstrip()
             if stripped.startswith("#") and len(stripped) > 1 and stripped[1] != " ":
                 indent_len = len(line_no_newline) - len(stripped)
-                self.issues.append(
+                append(
                     LintIssue(
                         i,
                         indent_len + 2,
@@ -1462,14 +1545,10 @@ class KconfigLinter:
 
         # Check indentation issues (pass 2 - needs context)
         in_help_block = False
-        for i, line in enumerate(lines, 1):
-            line_no_newline = line.rstrip("\n\r")
-            if not line_no_newline.strip():
+        for i, (line_no_newline, indent, stripped) in enumerate(scanned, 1):
+            if not stripped:
                 continue
 
-            stripped = line_no_newline.lstrip()
-            indent = line_no_newline[: len(line_no_newline) - len(stripped)]
-
             # Track help blocks for special indentation handling
             if stripped.startswith("help"):
                 in_help_block = True
@@ -1477,23 +1556,7 @@ class KconfigLinter:
             elif in_help_block:
                 # Check if we're still in help text
                 # Help text can have tab + spaces (that's the expected format)
-                if stripped.startswith(
-                    (
-                        "#",
-                        "config",
-                        "menuconfig",
-                        "choice",
-                        "menu",
-                        "if ",
-                        "endif",
-                        "endmenu",
-                        "endchoice",
-                        "source",
-                        "rsource",
-                        "comment ",
-                        "mainmenu",
-                    )
-                ):
+                if stripped.startswith(self._HELP_END_PREFIXES):
                     # We've hit a keyword, exit help block
                     in_help_block = False
                 else:
@@ -1506,7 +1569,7 @@ class KconfigLinter:
                             if line_no_newline.startswith(
                                 "\t"
                             ) and not line_no_newline.startswith(expected_prefix):
-                                self.issues.append(
+                                append(
                                     LintIssue(
                                         i,
                                         1,
@@ -1518,7 +1581,7 @@ class KconfigLinter:
 
             # Check for mixed tabs and spaces (but not in help text)
             if "\t" in indent and " " in indent:
-                self.issues.append(
+                append(
                     LintIssue(
                         i,
                         1,
@@ -1531,7 +1594,7 @@ class KconfigLinter:
             if indent:
                 if self.config.use_spaces:
                     if "\t" in indent:
-                        self.issues.append(
+                        append(
                             LintIssue(
                                 i,
                                 1,
@@ -1541,7 +1604,7 @@ class KconfigLinter:
                         )
                     # Check if indentation is multiple of configured spaces
                     elif len(indent) % self.config.primary_indent_spaces != 0:
-                        self.issues.append(
+                        append(
                             LintIssue(
                                 i,
                                 1,
@@ -1552,7 +1615,7 @@ class KconfigLinter:
                 else:
                     # Using tabs
                     if " " in indent:
-                        self.issues.append(
+                        append(
                             LintIssue(
                                 i,
                                 1,
@@ -1581,9 +1644,10 @@ class KconfigLinter:
 
     def _lint_config_entry(self, node: ConfigEntry):
         """Lint a config entry."""
+        append = self.issues.append
         # Check config name
         if len(node.name) > self.config.max_option_name_length:
-            self.issues.append(
+            append(
                 LintIssue(
                     node.line_number,
                     len(node.config_type) + 2,
@@ -1595,7 +1659,7 @@ class KconfigLinter:
         # Check uppercase if configured
         if self.config.enforce_uppercase_configs:
             if node.name != node.name.upper():
-                self.issues.append(
+                append(
                     LintIssue(
                         node.line_number,
                         len(node.config_type) + 2,
@@ -1608,7 +1672,7 @@ class KconfigLinter:
         if self.config.min_prefix_length > 0 and "_" in node.name:
             prefix = node.name.split("_")[0]
             if len(prefix) < self.config.min_prefix_length:
-                self.issues.append(
+                append(
                     LintIssue(
                         node.line_number,
                         len(node.config_type) + 2,
@@ -1630,52 +1694,43 @@ class KconfigLinter:
         self._lint_ast(node.statements, None)
 
     # Compatibility methods for tests
+
     def _get_line_type(self, line: str) -> str:
         """Determine the type of Kconfig line (for test compatibility)."""
         stripped = line.lstrip()
 
-        if stripped.startswith("#"):
-            return "comment_line"
-        elif stripped.startswith("config "):
-            return "config"
-        elif stripped.startswith("menuconfig "):
-            return "menuconfig"
-        elif stripped.startswith("menu "):
-            return "menu"
-        elif stripped.startswith("endmenu"):
-            return "endmenu"
-        elif stripped.startswith("choice"):
-            return "choice"
-        elif stripped.startswith("endchoice"):
-            return "endchoice"
-        elif stripped.startswith("if "):
-            return "if"
-        elif stripped.startswith("endif"):
-            return "endif"
-        elif stripped.startswith(("source ", "rsource ")):
-            return "source"
-        elif stripped.startswith("comment "):
-            return "comment"
-        elif stripped.startswith("help"):
-            return "help"
-        elif re.match(
-            r"^\s*(bool|tristate|string|int|hex|def_bool|def_tristate|prompt|default|depends on|select|imply|range|option)\s",
-            stripped,
+        for prefix, line_type in self._LINE_TYPE_PREFIXES:
+            if stripped.startswith(prefix):
+                return line_type
+
+        if not stripped:
+            return "other"
+
+        # split() only breaks on whitespace, so a longer line means the
+        # keyword is followed by whitespace
+        keyword = stripped.split(None, 1)[0]
+        if keyword in self._OPTION_KEYWORDS and len(stripped) > len(keyword):
+            return "option"
+        depends_on_len = len("depends on")
+        if (
+            stripped.startswith("depends on")
+            and stripped[depends_on_len : depends_on_len + 1].isspace()
         ):
             return "option"
-        else:
-            return "other"
+
+        return "other"
 
     def _check_config_name(self, line: str, line_num: int):
         """Check config/menuconfig name formatting (for test compatibility)."""
-        match = re.match(r"^\s*(config|menuconfig)\s+(\S+)", line)
+        match = self._CONFIG_NAME_RE.match(line)
         if not match:
             return
 
         config_name = match.group(2)
+        append = self.issues.append
 
         if len(config_name) > self.config.max_option_name_length:
-            self.issues.append(
+            append(
                 LintIssue(
                     line_num,
                     match.start(2) + 1,
@@ -1686,7 +1741,7 @@ class KconfigLinter:
 
         if self.config.enforce_uppercase_configs:
             if config_name != config_name.upper():
-                self.issues.append(
+                append(
                     LintIssue(
                         line_num,
                         match.start(2) + 1,
@@ -1698,7 +1753,7 @@ class KconfigLinter:
         if self.config.min_prefix_length > 0 and "_" in config_name:
             prefix = config_name.split("_")[0]
             if len(prefix) < self.config.min_prefix_length:
-                self.issues.append(
+                append(
                     LintIssue(
                         line_num,
                         match.start(2) + 1,
@@ -1709,16 +1764,19 @@ class KconfigLinter:
 
     def format_file(self, filepath: Path) -> tuple[list[str], list[LintIssue]]:
         """Format a Kconfig file and return the formatted lines."""
-        self.issues = []
-
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                content = f.read()
+            content = _read_file(filepath)
         except Exception as e:
-            self.issues.append(LintIssue(0, None, "error", f"Failed to read file: {e}"))
+            self.issues = [LintIssue(0, None, "error", f"Failed to read file: {e}")]
             return [], self.issues
 
-        ast = self.parser.parse(content)
+        return self.format_lines(content.splitlines(keepends=True))
+
+    def format_lines(self, lines: list[str]) -> tuple[list[str], list[LintIssue]]:
+        """Format Kconfig lines (with line endings) and return the formatted lines."""
+        self.issues = []
+
+        ast = self.parser.parse("".join(lines))
         formatted_lines = self.formatter.format(ast)
 
         # Add newlines
@@ -1729,6 +1787,35 @@ class KconfigLinter:
         return result, self.issues
 
 
+# Files at least this large are memory-mapped instead of read through a text stream
+_MMAP_THRESHOLD = 64 * 1024
+
+
+def _read_file(filepath: Path) -> str:
+    """Read a Kconfig file as UTF-8 text, memory-mapping large files."""
+    if os.path.getsize(filepath) < _MMAP_THRESHOLD:
+        with open(filepath, "r", encoding="utf-8") as f:
+            return f.read()
+
+    with (
+        open(filepath, "rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+    ):
+        content = str(mm, "utf-8")
+
+    # Match the universal-newline translation of the text-mode branch
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+
+def _scan_line(line: str) -> tuple[str, str, str]:
+    """Split a raw line into (text without line ending, indentation, content)."""
+    text = line.rstrip("\n\r")
+    content = text.lstrip()
+    return text, text[: len(text) - len(content)], content
+
+
 def _dump_ast(nodes: list[ASTNode], indent: int = 0):
     """Dump AST structure for debugging."""
     prefix = "  " * indent
@@ -1783,8 +1870,16 @@ def _dump_ast(nodes: list[ASTNode], indent: int = 0):
             print(f"{prefix}{type(node).__name__}")
 
 
-def main():
-    """Main entry point for the linter."""
+def main(argv: list[str] | None = None) -> int:
+    """Main entry point for the linter.
+
+    Args:
+        argv: Command-line arguments (without the program name). Defaults to
+            sys.argv[1:].
+
+    Returns:
+        Process exit code
+    """
     parser = argparse.ArgumentParser(
         description="Lint and format Kconfig files for style compliance",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -1886,7 +1981,7 @@ Examples:
         help="Print formatted output to stdout instead of linting (for debugging)",
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Start with preset or default
     if args.preset == "espidf":
@@ -1932,8 +2027,7 @@ Examples:
         if args.dump_ast:
             # AST dump mode
             try:
-                with open(filepath, "r", encoding="utf-8") as f:
-                    content = f.read()
+                content = _read_file(filepath)
                 ast = linter.parser.parse(content)
                 print(f"\n{'=' * 60}")
                 print(f"AST for {filepath}")
@@ -1941,7 +2035,7 @@ Examples:
                 _dump_ast(ast, indent=0)
             except Exception as e:
                 print(f"Error parsing {filepath}: {e}", file=sys.stderr)
-            exit(0)
+            return 0
 
         if args.print_formatted:
             # Print formatted output mode (for debugging)
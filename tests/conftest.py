@@ -0,0 +1,129 @@
+"""Shared fixtures for kconfigstyle tests."""
+
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from kconfigstyle import KconfigLinter, LinterConfig, main
+
+from .snippets import (
+    SNIPPET_LONGLINE,
+    SNIPPET_LOWER,
+    SNIPPET_SPACE_INDENT,
+    SNIPPET_TRAILING_SPACE,
+    SNIPPET_UPPER,
+)
+
+# Whether pytest_configure set PYTEST_DEBUG_TEMPROOT and must remove it
+_TEMPROOT_SET = pytest.StashKey[bool]()
+
+
+def pytest_configure(config):
+    """Put tmp_path directories on a RAM-backed filesystem when one is available.
+
+    An explicit --basetemp, PYTEST_DEBUG_TEMPROOT or TMPDIR still takes
+    precedence. The variable is removed again in pytest_unconfigure.
+    """
+    config.stash[_TEMPROOT_SET] = False
+    if (
+        sys.platform == "linux"
+        and config.option.basetemp is None
+        and "PYTEST_DEBUG_TEMPROOT" not in os.environ
+        and "TMPDIR" not in os.environ
+        and os.access("/dev/shm", os.W_OK)
+    ):
+        os.environ["PYTEST_DEBUG_TEMPROOT"] = "/dev/shm"
+        config.stash[_TEMPROOT_SET] = True
+
+
+def pytest_unconfigure(config):
+    """Undo the PYTEST_DEBUG_TEMPROOT override from pytest_configure."""
+    if config.stash.get(_TEMPROOT_SET, False):
+        os.environ.pop("PYTEST_DEBUG_TEMPROOT", None)
+
+
+@pytest.fixture(scope="session")
+def zephyr_linter():
+    """Linter with the Zephyr preset, shared across the test session."""
+    return KconfigLinter(LinterConfig.zephyr_preset())
+
+
+@pytest.fixture(scope="session")
+def espidf_linter():
+    """Linter with the ESP-IDF preset, shared across the test session."""
+    return KconfigLinter(LinterConfig.espidf_preset())
+
+
+@pytest.fixture
+def zephyr_config():
+    """Fresh Zephyr preset configuration for tests that customize it."""
+    return LinterConfig.zephyr_preset()
+
+
+@pytest.fixture
+def espidf_config():
+    """Fresh ESP-IDF preset configuration for tests that customize it."""
+    return LinterConfig.espidf_preset()
+
+
+def _write_snippet(tmp_path_factory, content):
+    """Write a Kconfig snippet to a fresh session temp directory."""
+    path = tmp_path_factory.mktemp("kcfg") / "Kconfig"
+    path.write_bytes(content)
+    return path
+
+
+# Read-only Kconfig files shared across the session; tests that modify
+# their input (e.g. --write) must create their own under tmp_path.
+
+
+@pytest.fixture(scope="session")
+def kconfig_test_file(tmp_path_factory):
+    """Well-formed Zephyr-style config entry."""
+    return _write_snippet(tmp_path_factory, SNIPPET_UPPER)
+
+
+@pytest.fixture(scope="session")
+def kconfig_trailing_space_file(tmp_path_factory):
+    """Config line with trailing whitespace."""
+    return _write_snippet(tmp_path_factory, SNIPPET_TRAILING_SPACE)
+
+
+@pytest.fixture(scope="session")
+def kconfig_lowercase_file(tmp_path_factory):
+    """Lowercase config name with ESP-IDF indentation."""
+    return _write_snippet(tmp_path_factory, SNIPPET_LOWER)
+
+
+@pytest.fixture(scope="session")
+def kconfig_longline_file(tmp_path_factory):
+    """Comment line 62 characters long."""
+    return _write_snippet(tmp_path_factory, SNIPPET_LONGLINE)
+
+
+@pytest.fixture(scope="session")
+def kconfig_space_indent_file(tmp_path_factory):
+    """Config entry indented with spaces, which Zephyr style rejects."""
+    return _write_snippet(tmp_path_factory, SNIPPET_SPACE_INDENT)
+
+
+@pytest.fixture
+def cli_runner(capsys):
+    """Run the kconfigstyle CLI in-process and capture its output.
+
+    Returns a callable taking the argument list (without the program name)
+    and returning a namespace with returncode, stdout and stderr, like
+    subprocess.run does.
+    """
+
+    def run(argv):
+        capsys.readouterr()
+        returncode = main([str(arg) for arg in argv])
+        captured = capsys.readouterr()
+        return SimpleNamespace(
+            returncode=returncode, stdout=captured.out, stderr=captured.err
+        )
+
+    return run
@@ -0,0 +1,19 @@
+"""Canned Kconfig inputs shared by the CLI tests and fixtures."""
+
+# Well-formed Zephyr-style config entry
+SNIPPET_UPPER = b'config TEST\n\tbool "Test"\n'
+
+# Lowercase config name with ESP-IDF indentation
+SNIPPET_LOWER = b'config lowercase\n    bool "Test"\n'
+
+# Comment line 62 characters long
+SNIPPET_LONGLINE = b"# " + b"x" * 60 + b"\n"
+
+# Config line with trailing whitespace
+SNIPPET_TRAILING_SPACE = b"config TEST  \n"
+
+# Config entry indented with spaces, which Zephyr style rejects
+SNIPPET_SPACE_INDENT = b'config TEST\n  bool "Test"\n'
+
+# Config entry with no indentation on its option line
+SNIPPET_NOINDENT = b'config TEST\nbool "Test"\n'
@@ -1,21 +1,27 @@
 """Tests for Kconfig linter functionality."""
 
+import runpy
 import subprocess
 import sys
-import tempfile
+from dataclasses import replace
+from itertools import groupby
 from pathlib import Path
 
-from kconfigstyle import KconfigLinter, LinterConfig
+import pytest
+
+from kconfigstyle import _MMAP_THRESHOLD, KconfigLinter
+
+from .snippets import SNIPPET_NOINDENT, SNIPPET_UPPER
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+_PY_CLI = (sys.executable, "-m", "kconfigstyle")
 
 
 class TestZephyrStyle:
     """Test Zephyr style linting."""
 
-    def test_valid_zephyr_file(self):
+    def test_valid_zephyr_file(self, zephyr_linter):
         """Test that a valid Zephyr file has no issues."""
-        config = LinterConfig.zephyr_preset()
-        linter = KconfigLinter(config)
-
         lines = [
             "# Network configuration\n",
             "\n",
@@ -31,111 +37,51 @@ class TestZephyrStyle:
             "\t  Enable IPv4 protocol support.\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
-
-        try:
-            issues = linter.lint_file(temp_path)
-            assert len(issues) == 0, f"Expected no issues, got: {issues}"
-        finally:
-            temp_path.unlink()
+        issues = zephyr_linter.lint_lines(lines)
+        assert len(issues) == 0, f"Expected no issues, got: {issues}"
 
-    def test_trailing_whitespace(self):
+    def test_trailing_whitespace(self, zephyr_linter):
         """Test detection of trailing whitespace."""
-        config = LinterConfig.zephyr_preset()
-        linter = KconfigLinter(config)
-
         lines = [
             "config TEST\n",
             '\tbool "Test"  \n',  # Trailing spaces
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
-
-        try:
-            issues = linter.lint_file(temp_path)
-            assert len(issues) == 1
-            assert "Trailing whitespace" in issues[0].message
-            assert issues[0].line_number == 2
-        finally:
-            temp_path.unlink()
+        issues = zephyr_linter.lint_lines(lines)
+        assert len(issues) == 1
+        assert "Trailing whitespace" in issues[0].message
+        assert issues[0].line_number == 2
 
-    def test_line_too_long(self):
+    def test_line_too_long(self, zephyr_linter):
         """Test detection of lines exceeding max length."""
-        config = LinterConfig.zephyr_preset()
-        linter = KconfigLinter(config)
-
         long_line = "# " + "x" * 100 + "\n"
         lines = [long_line]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
-
-        try:
-            issues = linter.lint_file(temp_path)
-            assert len(issues) == 1
-            assert "exceeds 100 characters" in issues[0].message
-        finally:
-            temp_path.unlink()
+        issues = zephyr_linter.lint_lines(lines)
+        assert len(issues) == 1
+        assert "exceeds 100 characters" in issues[0].message
 
-    def test_spaces_instead_of_tabs(self):
+    def test_spaces_instead_of_tabs(self, zephyr_linter):
         """Test detection of spaces when tabs are required."""
-        config = LinterConfig.zephyr_preset()
-        linter = KconfigLinter(config)
-
         lines = [
             "config TEST\n",
             '    bool "Test"\n',  # 4 spaces instead of tab
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
-
-        try:
-            issues = linter.lint_file(temp_path)
-            assert len(issues) == 1
-            assert "Use tabs for indentation" in issues[0].message
-        finally:
-            temp_path.unlink()
+        issues = zephyr_linter.lint_lines(lines)
+        assert len(issues) == 1
+        assert "Use tabs for indentation" in issues[0].message
 
-    def test_comment_without_space(self):
+    def test_comment_without_space(self, zephyr_linter):
         """Test detection of comments without space after #."""
-        config = LinterConfig.zephyr_preset()
-        linter = KconfigLinter(config)
-
         lines = ["#Bad comment\n"]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
-
-        try:
-            issues = linter.lint_file(temp_path)
-            assert len(issues) == 1
-            assert "space after #" in issues[0].message
-        finally:
-            temp_path.unlink()
+        issues = zephyr_linter.lint_lines(lines)
+        assert len(issues) == 1
+        assert "space after #" in issues[0].message
 
-    def test_help_text_indentation(self):
+    def test_help_text_indentation(self, zephyr_linter):
         """Test help text indentation checking."""
-        config = LinterConfig.zephyr_preset()
-        linter = KconfigLinter(config)
-
         lines = [
             "config TEST\n",
             '\tbool "Test"\n',
@@ -143,28 +89,16 @@ class TestZephyrStyle:
             "\tWrong indentation.\n",  # Should be tab + 2 spaces
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
-
-        try:
-            issues = linter.lint_file(temp_path)
-            assert len(issues) == 1
-            assert "Help text should be indented" in issues[0].message
-        finally:
-            temp_path.unlink()
+        issues = zephyr_linter.lint_lines(lines)
+        assert len(issues) == 1
+        assert "Help text should be indented" in issues[0].message
 
 
 class TestESPIDFStyle:
     """Test ESP-IDF style linting."""
 
-    def test_valid_espidf_file(self):
+    def test_valid_espidf_file(self, espidf_linter):
         """Test that a valid ESP-IDF file has no issues."""
-        config = LinterConfig.espidf_preset()
-        linter = KconfigLinter(config)
-
         lines = [
             'menu "Network"\n',
             "    config NET_ENABLED\n",
@@ -174,96 +108,46 @@ class TestESPIDFStyle:
             "endmenu\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
+        issues = espidf_linter.lint_lines(lines)
+        assert len(issues) == 0, f"Expected no issues, got: {issues}"
 
-        try:
-            issues = linter.lint_file(temp_path)
-            assert len(issues) == 0, f"Expected no issues, got: {issues}"
-        finally:
-            temp_path.unlink()
-
-    def test_uppercase_config_names(self):
+    def test_uppercase_config_names(self, espidf_linter):
         """Test enforcement of uppercase config names."""
-        config = LinterConfig.espidf_preset()
-        linter = KconfigLinter(config)
-
         lines = [
             "config LowercaseConfig\n",
             '    bool "Test"\n',
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
-
-        try:
-            issues = linter.lint_file(temp_path)
-            assert len(issues) == 1
-            assert "must be uppercase" in issues[0].message
-        finally:
-            temp_path.unlink()
+        issues = espidf_linter.lint_lines(lines)
+        assert len(issues) == 1
+        assert "must be uppercase" in issues[0].message
 
-    def test_tabs_not_allowed(self):
+    def test_tabs_not_allowed(self, espidf_linter):
         """Test that tabs are not allowed in ESP-IDF style."""
-        config = LinterConfig.espidf_preset()
-        linter = KconfigLinter(config)
-
         lines = [
             "config TEST\n",
             '\tbool "Test"\n',  # Tab not allowed
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
-
-        try:
-            issues = linter.lint_file(temp_path)
-            assert any(
-                "Use spaces for indentation" in issue.message for issue in issues
-            )
-        finally:
-            temp_path.unlink()
+        issues = espidf_linter.lint_lines(lines)
+        assert any("Use spaces for indentation" in issue.message for issue in issues)
 
-    def test_indentation_multiple_of_4(self):
+    def test_indentation_multiple_of_4(self, espidf_linter):
         """Test that indentation must be multiple of 4 spaces."""
-        config = LinterConfig.espidf_preset()
-        linter = KconfigLinter(config)
-
         lines = [
             "config TEST\n",
             '  bool "Test"\n',  # 2 spaces, should be 4
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
-
-        try:
-            issues = linter.lint_file(temp_path)
-            assert any("multiple of 4" in issue.message for issue in issues)
-        finally:
-            temp_path.unlink()
+        issues = espidf_linter.lint_lines(lines)
+        assert any("multiple of 4" in issue.message for issue in issues)
 
 
 class TestFormatter:
     """Test formatting functionality."""
 
-    def test_format_tabs_to_tabs(self):
+    def test_format_tabs_to_tabs(self, zephyr_linter):
         """Test formatting with tab indentation."""
-        config = LinterConfig.zephyr_preset()
-        linter = KconfigLinter(config)
-
         input_lines = [
             "config TEST\n",
             '  bool "Test"\n',  # Wrong: spaces
@@ -271,69 +155,32 @@ class TestFormatter:
             "   Help text.\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(input_lines)
-            temp_path = Path(f.name)
+        formatted, _ = zephyr_linter.format_lines(input_lines)
 
-        try:
-            formatted, _ = linter.format_file(temp_path)
-
-            # Check that output uses tabs
-            assert any("\t" in line for line in formatted), "Should contain tabs"
+        # Check that output uses tabs
+        assert any("\t" in line for line in formatted), "Should contain tabs"
 
-            # Check help text indentation (tab + 2 spaces)
-            help_text_line = [line for line in formatted if "Help text" in line][0]
-            assert help_text_line.startswith("\t  "), (
-                "Help text should be tab + 2 spaces"
-            )
-        finally:
-            temp_path.unlink()
+        # Check help text indentation (tab + 2 spaces)
+        help_text_line = [line for line in formatted if "Help text" in line][0]
+        assert help_text_line.startswith("\t  "), "Help text should be tab + 2 spaces"
 
-    def test_format_fix_comment_spacing(self):
+    def test_format_fix_comment_spacing(self, zephyr_linter):
         """Test that formatter adds space after # in comments."""
-        config = LinterConfig.zephyr_preset()
-        linter = KconfigLinter(config)
-
         input_lines = ["#Bad comment\n"]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(input_lines)
-            temp_path = Path(f.name)
+        formatted, _ = zephyr_linter.format_lines(input_lines)
+        assert formatted[0] == "# Bad comment\n"
 
-        try:
-            formatted, _ = linter.format_file(temp_path)
-            assert formatted[0] == "# Bad comment\n"
-        finally:
-            temp_path.unlink()
-
-    def test_format_remove_trailing_whitespace(self):
+    def test_format_remove_trailing_whitespace(self, zephyr_linter):
         """Test that formatter removes trailing whitespace."""
-        config = LinterConfig.zephyr_preset()
-        linter = KconfigLinter(config)
-
         input_lines = ["config TEST  \n"]  # Trailing spaces
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(input_lines)
-            temp_path = Path(f.name)
+        formatted, _ = zephyr_linter.format_lines(input_lines)
+        assert formatted[0] == "config TEST\n"
 
-        try:
-            formatted, _ = linter.format_file(temp_path)
-            assert formatted[0] == "config TEST\n"
-        finally:
-            temp_path.unlink()
-
-    def test_consolidate_empty_lines(self):
+    def test_consolidate_empty_lines(self, zephyr_config):
         """Test consolidating multiple empty lines."""
-        config = LinterConfig.zephyr_preset()
-        config.consolidate_empty_lines = True
-        linter = KconfigLinter(config)
+        linter = KconfigLinter(replace(zephyr_config, consolidate_empty_lines=True))
 
         input_lines = [
             "config TEST1\n",
@@ -345,34 +192,19 @@ class TestFormatter:
             '\tbool "Test 2"\n',
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(input_lines)
-            temp_path = Path(f.name)
+        formatted, _ = linter.format_lines(input_lines)
 
-        try:
-            formatted, _ = linter.format_file(temp_path)
-
-            # Count consecutive empty lines
-            empty_count = 0
-            max_consecutive = 0
-            for line in formatted:
-                if line.strip() == "":
-                    empty_count += 1
-                    max_consecutive = max(max_consecutive, empty_count)
-                else:
-                    empty_count = 0
-
-            assert max_consecutive <= 1, "Should have at most 1 consecutive empty line"
-        finally:
-            temp_path.unlink()
+        # Lengths of each run of consecutive empty lines
+        runs = [
+            sum(1 for _ in group)
+            for is_empty, group in groupby(formatted, key=lambda line: not line.strip())
+            if is_empty
+        ]
 
-    def test_hierarchical_indenting(self):
-        """Test hierarchical indentation for nested items."""
-        config = LinterConfig.espidf_preset()
-        linter = KconfigLinter(config)
+        assert max(runs, default=0) <= 1, "Should have at most 1 consecutive empty line"
 
+    def test_hierarchical_indenting(self, espidf_linter):
+        """Test hierarchical indentation for nested items."""
         input_lines = [
             'menu "Network"\n',
             "config NET\n",
@@ -382,236 +214,194 @@ class TestFormatter:
             "endmenu\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(input_lines)
-            temp_path = Path(f.name)
+        formatted, _ = espidf_linter.format_lines(input_lines)
 
-        try:
-            formatted, _ = linter.format_file(temp_path)
-
-            # Check indentation levels
-            assert formatted[0] == 'menu "Network"\n'
-            assert formatted[1].startswith("    config NET")  # 4 spaces
-            assert formatted[2].startswith("        bool")  # 8 spaces
-            assert formatted[3].startswith("        help")  # 8 spaces
-            assert formatted[4].startswith("            Help")  # 12 spaces
-            assert formatted[5] == "\n"  # Blank line before endmenu
-            assert formatted[6] == "endmenu\n"
-        finally:
-            temp_path.unlink()
+        # Check indentation levels
+        assert formatted[0] == 'menu "Network"\n'
+        assert formatted[1].startswith("    config NET")  # 4 spaces
+        assert formatted[2].startswith("        bool")  # 8 spaces
+        assert formatted[3].startswith("        help")  # 8 spaces
+        assert formatted[4].startswith("            Help")  # 12 spaces
+        assert formatted[5] == "\n"  # Blank line before endmenu
+        assert formatted[6] == "endmenu\n"
 
 
 class TestLineTypeDetection:
     """Test line type detection."""
 
-    def test_detect_config(self):
-        """Test detection of config keyword."""
-        config = LinterConfig.zephyr_preset()
-        linter = KconfigLinter(config)
-
-        assert linter._get_line_type("config TEST") == "config"
-        assert linter._get_line_type("  config TEST") == "config"
-
-    def test_detect_menuconfig(self):
-        """Test detection of menuconfig keyword."""
-        config = LinterConfig.zephyr_preset()
-        linter = KconfigLinter(config)
-
-        assert linter._get_line_type("menuconfig TEST") == "menuconfig"
-
-    def test_detect_help(self):
-        """Test detection of help keyword."""
-        config = LinterConfig.zephyr_preset()
-        linter = KconfigLinter(config)
-
-        assert linter._get_line_type("help") == "help"
-        assert linter._get_line_type("\thelp") == "help"
-
-    def test_detect_bool(self):
-        """Test detection of bool option."""
-        config = LinterConfig.zephyr_preset()
-        linter = KconfigLinter(config)
-
-        assert linter._get_line_type('\tbool "Test"') == "option"
-        assert linter._get_line_type('\tint "Value"') == "option"
-        assert linter._get_line_type('\tstring "Text"') == "option"
-
-    def test_detect_depends(self):
-        """Test detection of depends on."""
-        config = LinterConfig.zephyr_preset()
-        linter = KconfigLinter(config)
-
-        assert linter._get_line_type("\tdepends on FOO") == "option"
-
-    def test_detect_comment(self):
-        """Test detection of comments."""
-        config = LinterConfig.zephyr_preset()
-        linter = KconfigLinter(config)
-
-        assert linter._get_line_type("# Comment") == "comment_line"
-        assert linter._get_line_type("  # Comment") == "comment_line"
+    @pytest.mark.parametrize(
+        ("line", "expected"),
+        [
+            ("config TEST", "config"),
+            ("  config TEST", "config"),
+            ("menuconfig TEST", "menuconfig"),
+            ("help", "help"),
+            ("\thelp", "help"),
+            ('\tbool "Test"', "option"),
+            ('\tint "Value"', "option"),
+            ('\tstring "Text"', "option"),
+            ("\tdepends on FOO", "option"),
+            ("# Comment", "comment_line"),
+            ("  # Comment", "comment_line"),
+            ('menu "Test"', "menu"),
+            ("endmenu", "endmenu"),
+            ("choice", "choice"),
+            ("endchoice", "endchoice"),
+            ("if FOO", "if"),
+            ("endif", "endif"),
+            ('source "path"', "source"),
+            ('comment "test"', "comment"),
+            ('\ttristate "Test"', "option"),
+            ('\thex "Value"', "option"),
+            ("\tdef_bool y", "option"),
+            ("\tdef_tristate y", "option"),
+            ('\tprompt "Text"', "option"),
+            ("\tdefault y", "option"),
+            ("\tselect FOO", "option"),
+            ("\timply BAR", "option"),
+            ("\trange 0 100", "option"),
+            ('\toption env="VAR"', "option"),
+            ("some random text", "other"),
+        ],
+    )
+    def test_line_type(self, zephyr_linter, line, expected):
+        """Test detection of each line type."""
+        assert zephyr_linter._get_line_type(line) == expected
 
 
 class TestConfigNameValidation:
     """Test config name validation."""
 
-    def test_config_name_length(self):
+    def test_config_name_length(self, tmp_path, zephyr_config):
         """Test detection of overly long config names."""
-        config = LinterConfig.zephyr_preset()
-        config.max_option_name_length = 10
-        linter = KconfigLinter(config)
+        linter = KconfigLinter(replace(zephyr_config, max_option_name_length=10))
 
         lines = [f"config {'A' * 20}\n"]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
+        temp_path = tmp_path / "Kconfig"
+        temp_path.write_text("".join(lines))
 
-        try:
-            issues = linter.lint_file(temp_path)
-            assert any("exceeds 10 characters" in issue.message for issue in issues)
-        finally:
-            temp_path.unlink()
+        issues = linter.lint_file(temp_path)
+        assert any("exceeds 10 characters" in issue.message for issue in issues)
 
-    def test_prefix_length(self):
+    def test_prefix_length(self, tmp_path, espidf_linter):
         """Test detection of short prefixes."""
-        config = LinterConfig.espidf_preset()
-        linter = KconfigLinter(config)
-
         lines = ["config AB_TEST\n"]  # Prefix "AB" is only 2 chars
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
+        temp_path = tmp_path / "Kconfig"
+        temp_path.write_text("".join(lines))
 
-        try:
-            issues = linter.lint_file(temp_path)
-            assert any("at least 3 characters" in issue.message for issue in issues)
-        finally:
-            temp_path.unlink()
+        issues = espidf_linter.lint_file(temp_path)
+        assert any("at least 3 characters" in issue.message for issue in issues)
 
 
 class TestCustomConfiguration:
     """Test custom configuration options."""
 
-    def test_use_spaces_option(self):
+    def test_use_spaces_option(self, zephyr_config):
         """Test custom use_spaces option."""
-        config = LinterConfig.zephyr_preset()
-        config.use_spaces = True
-        config.primary_indent_spaces = 2
-
-        linter = KconfigLinter(config)
+        linter = KconfigLinter(
+            replace(zephyr_config, use_spaces=True, primary_indent_spaces=2)
+        )
 
         lines = [
             "config TEST\n",
             '\tbool "Test"\n',  # Tab when spaces required
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
+        issues = linter.lint_lines(lines)
+        assert any("Use spaces" in issue.message for issue in issues)
 
-        try:
-            issues = linter.lint_file(temp_path)
-            assert any("Use spaces" in issue.message for issue in issues)
-        finally:
-            temp_path.unlink()
-
-    def test_custom_line_length(self):
+    def test_custom_line_length(self, zephyr_config):
         """Test custom max line length."""
-        config = LinterConfig.zephyr_preset()
-        config.max_line_length = 50
-
-        linter = KconfigLinter(config)
+        linter = KconfigLinter(replace(zephyr_config, max_line_length=50))
 
         lines = ["# " + "x" * 60 + "\n"]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
-
-        try:
-            issues = linter.lint_file(temp_path)
-            assert any("exceeds 50 characters" in issue.message for issue in issues)
-        finally:
-            temp_path.unlink()
+        issues = linter.lint_lines(lines)
+        assert any("exceeds 50 characters" in issue.message for issue in issues)
 
 
 class TestEdgeCases:
     """Test edge cases and error handling."""
 
-    def test_file_not_found(self):
+    def test_file_not_found(self, zephyr_linter):
         """Test handling of non-existent file."""
-        config = LinterConfig.zephyr_preset()
-        linter = KconfigLinter(config)
-
-        issues = linter.lint_file(Path("/nonexistent/file.Kconfig"))
+        issues = zephyr_linter.lint_file(Path("/nonexistent/file.Kconfig"))
         assert len(issues) == 1
         assert "Failed to read file" in issues[0].message
 
-    def test_format_file_not_found(self):
-        """Test format handling of non-existent file."""
-        config = LinterConfig.zephyr_preset()
-        linter = KconfigLinter(config)
+    @pytest.mark.parametrize("newline", ["\n", "\r\n"], ids=["lf", "crlf"])
+    def test_large_file(self, tmp_path, zephyr_linter, newline):
+        """Test that large (memory-mapped) files lint the same as in-memory lines."""
+        lines = [
+            f"config TEST_{i}\n" if i % 3 == 0 else '  bool "Test"  \n'
+            for i in range(10000)
+        ]
+
+        temp_path = tmp_path / "Kconfig"
+        temp_path.write_bytes("".join(lines).replace("\n", newline).encode())
+        assert temp_path.stat().st_size >= _MMAP_THRESHOLD
+
+        issues = [str(issue) for issue in zephyr_linter.lint_file(temp_path)]
+        expected = [str(issue) for issue in zephyr_linter.lint_lines(lines)]
+        assert issues == expected
+        assert len(issues) > 0
 
-        formatted, issues = linter.format_file(Path("/nonexistent/file.Kconfig"))
+    def test_format_file_not_found(self, zephyr_linter):
+        """Test format handling of non-existent file."""
+        formatted, issues = zephyr_linter.format_file(Path("/nonexistent/file.Kconfig"))
         assert len(formatted) == 0
         assert len(issues) == 1
         assert "Failed to read file" in issues[0].message
 
-    def test_mixed_tabs_and_spaces(self):
-        """Test detection of mixed tabs and spaces."""
-        config = LinterConfig.zephyr_preset()
-        linter = KconfigLinter(config)
+    def test_format_file_matches_format_lines(self, tmp_path, zephyr_linter):
+        """Test that formatting a file matches formatting its lines in memory."""
+        input_lines = [
+            "#Bad comment\n",
+            "config TEST  \n",
+            '  bool "Test"\n',
+        ]
 
+        temp_path = tmp_path / "Kconfig"
+        temp_path.write_text("".join(input_lines))
+
+        assert zephyr_linter.format_file(temp_path) == zephyr_linter.format_lines(
+            input_lines
+        )
+
+    def test_mixed_tabs_and_spaces(self, zephyr_linter):
+        """Test detection of mixed tabs and spaces."""
         lines = [
             "config TEST\n",
             '\t  bool "Test"\n',  # Tab + spaces mixed
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
+        issues = zephyr_linter.lint_lines(lines)
+        assert any("Mixed tabs and spaces" in issue.message for issue in issues)
 
-        try:
-            issues = linter.lint_file(temp_path)
-            assert any("Mixed tabs and spaces" in issue.message for issue in issues)
-        finally:
-            temp_path.unlink()
-
-    def test_empty_file(self):
+    def test_empty_file(self, zephyr_linter):
         """Test handling of empty file."""
-        config = LinterConfig.zephyr_preset()
-        linter = KconfigLinter(config)
+        issues = zephyr_linter.lint_lines([])
+        assert len(issues) == 0
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            temp_path = Path(f.name)
+    def test_whitespace_only_line(self, zephyr_linter):
+        """Test that blank lines containing whitespace are still checked."""
+        lines = [
+            "config TEST\n",
+            "\n",
+            "  \t\n",
+            '\tbool "Test"\n',
+        ]
 
-        try:
-            issues = linter.lint_file(temp_path)
-            assert len(issues) == 0
-        finally:
-            temp_path.unlink()
+        issues = zephyr_linter.lint_lines(lines)
+        assert len(issues) == 1
+        assert "Trailing whitespace" in issues[0].message
+        assert issues[0].line_number == 3
 
-    def test_consolidate_empty_lines_linting(self):
+    def test_consolidate_empty_lines_linting(self, zephyr_config):
         """Test linting with consolidate empty lines option."""
-        config = LinterConfig.zephyr_preset()
-        config.consolidate_empty_lines = True
-        linter = KconfigLinter(config)
+        linter = KconfigLinter(replace(zephyr_config, consolidate_empty_lines=True))
 
         lines = [
             "config TEST1\n",
@@ -621,100 +411,40 @@ class TestEdgeCases:
             "config TEST2\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
+        issues = linter.lint_lines(lines)
+        assert any(
+            "Multiple consecutive empty lines" in issue.message for issue in issues
+        )
 
-        try:
-            issues = linter.lint_file(temp_path)
-            assert any(
-                "Multiple consecutive empty lines" in issue.message for issue in issues
-            )
-        finally:
-            temp_path.unlink()
-
-    def test_all_line_types(self):
-        """Test detection of all line types."""
-        config = LinterConfig.zephyr_preset()
-        linter = KconfigLinter(config)
-
-        assert linter._get_line_type('menu "Test"') == "menu"
-        assert linter._get_line_type("endmenu") == "endmenu"
-        assert linter._get_line_type("choice") == "choice"
-        assert linter._get_line_type("endchoice") == "endchoice"
-        assert linter._get_line_type("if FOO") == "if"
-        assert linter._get_line_type("endif") == "endif"
-        assert linter._get_line_type('source "path"') == "source"
-        assert linter._get_line_type('comment "test"') == "comment"
-        assert linter._get_line_type('\ttristate "Test"') == "option"
-        assert linter._get_line_type('\thex "Value"') == "option"
-        assert linter._get_line_type("\tdef_bool y") == "option"
-        assert linter._get_line_type("\tdef_tristate y") == "option"
-        assert linter._get_line_type('\tprompt "Text"') == "option"
-        assert linter._get_line_type("\tdefault y") == "option"
-        assert linter._get_line_type("\tselect FOO") == "option"
-        assert linter._get_line_type("\timply BAR") == "option"
-        assert linter._get_line_type("\trange 0 100") == "option"
-        assert linter._get_line_type('\toption env="VAR"') == "option"
-        assert linter._get_line_type("some random text") == "other"
-
-    def test_config_name_without_underscore(self):
+    def test_config_name_without_underscore(self, espidf_linter):
         """Test config name validation without underscore."""
-        config = LinterConfig.espidf_preset()
-        linter = KconfigLinter(config)
-
         lines = ["config TESTING\n"]  # No underscore, no prefix warning
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
-
-        try:
-            issues = linter.lint_file(temp_path)
-            # Should not complain about prefix length
-            assert not any("prefix" in issue.message.lower() for issue in issues)
-        finally:
-            temp_path.unlink()
+        issues = espidf_linter.lint_lines(lines)
+        # Should not complain about prefix length
+        assert not any("prefix" in issue.message.lower() for issue in issues)
 
-    def test_invalid_config_line(self):
+    def test_invalid_config_line(self, zephyr_config):
         """Test config line that doesn't match pattern."""
-        config = LinterConfig.zephyr_preset()
-        linter = KconfigLinter(config)
+        linter = KconfigLinter(zephyr_config)
 
         # _check_config_name should handle lines that don't match
         linter._check_config_name("config", 1)
         assert len(linter.issues) == 0  # Should not crash or add issues
 
-    def test_comment_with_only_hash(self):
+    def test_comment_with_only_hash(self, zephyr_linter):
         """Test single # character without text."""
-        config = LinterConfig.zephyr_preset()
-        linter = KconfigLinter(config)
-
         lines = ["#\n"]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
-
-        try:
-            issues = linter.lint_file(temp_path)
-            # Should not complain about single #
-            assert not any("space after #" in issue.message for issue in issues)
-        finally:
-            temp_path.unlink()
+        issues = zephyr_linter.lint_lines(lines)
+        # Should not complain about single #
+        assert not any("space after #" in issue.message for issue in issues)
 
-    def test_format_with_spaces_hierarchical(self):
+    def test_format_with_spaces_hierarchical(self, zephyr_config):
         """Test formatting with spaces and hierarchical indenting."""
-        config = LinterConfig.zephyr_preset()
-        config.use_spaces = True
-        config.indent_sub_items = True
-        linter = KconfigLinter(config)
+        linter = KconfigLinter(
+            replace(zephyr_config, use_spaces=True, indent_sub_items=True)
+        )
 
         input_lines = [
             'menu "Test"\n',
@@ -725,24 +455,13 @@ class TestEdgeCases:
             "endmenu\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(input_lines)
-            temp_path = Path(f.name)
-
-        try:
-            formatted, _ = linter.format_file(temp_path)
-            # Verify spaces are used
-            assert all("\t" not in line for line in formatted if line.strip())
-        finally:
-            temp_path.unlink()
+        formatted, _ = linter.format_lines(input_lines)
+        # Verify spaces are used
+        assert all("\t" not in line for line in formatted if line.strip())
 
-    def test_format_tabs_hierarchical(self):
+    def test_format_tabs_hierarchical(self, zephyr_config):
         """Test formatting with tabs and hierarchical indenting."""
-        config = LinterConfig.zephyr_preset()
-        config.indent_sub_items = True
-        linter = KconfigLinter(config)
+        linter = KconfigLinter(replace(zephyr_config, indent_sub_items=True))
 
         input_lines = [
             'menu "Test"\n',
@@ -751,48 +470,25 @@ class TestEdgeCases:
             "endmenu\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(input_lines)
-            temp_path = Path(f.name)
+        formatted, _ = linter.format_lines(input_lines)
+        # Config should be indented with 1 tab (inside menu)
+        assert formatted[1].startswith("\tconfig")
 
-        try:
-            formatted, _ = linter.format_file(temp_path)
-            # Config should be indented with 1 tab (inside menu)
-            assert formatted[1].startswith("\tconfig")
-        finally:
-            temp_path.unlink()
-
-    def test_format_other_line_type(self):
+    def test_format_other_line_type(self, zephyr_linter):
         """Test formatting of 'other' line types."""
-        config = LinterConfig.zephyr_preset()
-        linter = KconfigLinter(config)
-
         input_lines = [
             "config FOO\n",
             '  bool "Test"\n',
             "  some random text\n",  # 'other' type
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(input_lines)
-            temp_path = Path(f.name)
+        formatted, _ = zephyr_linter.format_lines(input_lines)
+        # Other line should be indented like an option
+        assert formatted[2].startswith("\tsome random text")
 
-        try:
-            formatted, _ = linter.format_file(temp_path)
-            # Other line should be indented like an option
-            assert formatted[2].startswith("\tsome random text")
-        finally:
-            temp_path.unlink()
-
-    def test_format_empty_line_not_consolidate(self):
+    def test_format_empty_line_not_consolidate(self, zephyr_config):
         """Test formatting preserves multiple empty lines when not consolidating."""
-        config = LinterConfig.zephyr_preset()
-        config.consolidate_empty_lines = False
-        linter = KconfigLinter(config)
+        linter = KconfigLinter(replace(zephyr_config, consolidate_empty_lines=False))
 
         input_lines = [
             "config TEST1\n",
@@ -801,24 +497,12 @@ class TestEdgeCases:
             "config TEST2\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(input_lines)
-            temp_path = Path(f.name)
-
-        try:
-            formatted, _ = linter.format_file(temp_path)
-            empty_count = sum(1 for line in formatted if line.strip() == "")
-            assert empty_count == 2  # Both empty lines preserved
-        finally:
-            temp_path.unlink()
+        formatted, _ = linter.format_lines(input_lines)
+        empty_count = sum(1 for line in formatted if line.strip() == "")
+        assert empty_count == 2  # Both empty lines preserved
 
-    def test_help_keyword_in_help_section(self):
+    def test_help_keyword_in_help_section(self, zephyr_linter):
         """Test that help keyword itself doesn't get checked as help text."""
-        config = LinterConfig.zephyr_preset()
-        linter = KconfigLinter(config)
-
         lines = [
             "config TEST\n",
             '\tbool "Test"\n',
@@ -826,17 +510,8 @@ class TestEdgeCases:
             "\t  Text.\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
-
-        try:
-            issues = linter.lint_file(temp_path)
-            assert len(issues) == 0
-        finally:
-            temp_path.unlink()
+        issues = zephyr_linter.lint_lines(lines)
+        assert len(issues) == 0
 
     def test_lint_issue_string_representation(self):
         """Test LintIssue string formatting."""
@@ -852,12 +527,11 @@ class TestEdgeCases:
 class TestHelpTextReflow:
     """Test help text reflow functionality."""
 
-    def test_reflow_basic(self):
+    def test_reflow_basic(self, zephyr_config):
         """Test basic help text reflow."""
-        config = LinterConfig.zephyr_preset()
-        config.reflow_help_text = True
-        config.max_line_length = 80
-        linter = KconfigLinter(config)
+        linter = KconfigLinter(
+            replace(zephyr_config, reflow_help_text=True, max_line_length=80)
+        )
 
         input_lines = [
             "config TEST\n",
@@ -866,37 +540,27 @@ class TestHelpTextReflow:
             "\t  This is a very long help text that should be reflowed to fit within the maximum line length setting when the reflow option is enabled.\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(input_lines)
-            temp_path = Path(f.name)
-
-        try:
-            formatted, _ = linter.format_file(temp_path)
+        formatted, _ = linter.format_lines(input_lines)
 
-            # Check that all lines are within length limit
-            for line in formatted:
-                assert len(line.rstrip("\n")) <= 80, f"Line exceeds 80 chars: {line}"
+        # Check that all lines are within length limit
+        for line in formatted:
+            assert len(line.rstrip("\n")) <= 80, f"Line exceeds 80 chars: {line}"
 
-            # Check that we have multiple help text lines (index 3 onwards after help keyword)
-            help_text_lines = [
-                line
-                for line in formatted[3:]
-                if line.strip() and not line.strip().startswith("config")
-            ]
-            assert len(help_text_lines) > 1, (
-                f"Help text should be wrapped into multiple lines, got: {help_text_lines}"
-            )
-        finally:
-            temp_path.unlink()
+        # Check that we have multiple help text lines (index 3 onwards after help keyword)
+        help_text_lines = [
+            line
+            for line in formatted[3:]
+            if line.strip() and not line.strip().startswith("config")
+        ]
+        assert len(help_text_lines) > 1, (
+            f"Help text should be wrapped into multiple lines, got: {help_text_lines}"
+        )
 
-    def test_reflow_with_paragraphs(self):
+    def test_reflow_with_paragraphs(self, zephyr_config):
         """Test that reflow preserves paragraph breaks."""
-        config = LinterConfig.zephyr_preset()
-        config.reflow_help_text = True
-        config.max_line_length = 60
-        linter = KconfigLinter(config)
+        linter = KconfigLinter(
+            replace(zephyr_config, reflow_help_text=True, max_line_length=60)
+        )
 
         input_lines = [
             "config TEST\n",
@@ -907,28 +571,18 @@ class TestHelpTextReflow:
             "\t  Second paragraph also with long text.\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(input_lines)
-            temp_path = Path(f.name)
+        formatted, _ = linter.format_lines(input_lines)
 
-        try:
-            formatted, _ = linter.format_file(temp_path)
-
-            # Check that there's an empty line between paragraphs
-            assert any(line.strip() == "" for line in formatted[3:]), (
-                "Should preserve paragraph break"
-            )
-        finally:
-            temp_path.unlink()
+        # Check that there's an empty line between paragraphs
+        assert any(line.strip() == "" for line in formatted[3:]), (
+            "Should preserve paragraph break"
+        )
 
-    def test_reflow_with_spaces(self):
+    def test_reflow_with_spaces(self, espidf_config):
         """Test reflow with space indentation (ESP-IDF style)."""
-        config = LinterConfig.espidf_preset()
-        config.reflow_help_text = True
-        config.max_line_length = 80
-        linter = KconfigLinter(config)
+        linter = KconfigLinter(
+            replace(espidf_config, reflow_help_text=True, max_line_length=80)
+        )
 
         input_lines = [
             "config TEST_OPTION\n",
@@ -937,41 +591,29 @@ class TestHelpTextReflow:
             "        This is a very long help text that should be reflowed to fit within the maximum line length setting. It should use space indentation.\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(input_lines)
-            temp_path = Path(f.name)
+        formatted, _ = linter.format_lines(input_lines)
 
-        try:
-            formatted, _ = linter.format_file(temp_path)
+        # Find help text lines (after the help keyword)
+        help_start = next(
+            i
+            for i, line in enumerate(formatted)
+            if "help" in line.lower() and "bool" not in line.lower()
+        )
+        help_lines = [line for line in formatted[help_start + 1 :] if line.strip()]
 
-            # Find help text lines (after the help keyword)
-            help_start = next(
-                i
-                for i, line in enumerate(formatted)
-                if "help" in line.lower() and "bool" not in line.lower()
-            )
-            help_lines = [line for line in formatted[help_start + 1 :] if line.strip()]
+        # Check all help lines use spaces (no tabs)
+        for line in help_lines:
+            assert "\t" not in line, f"Help text should use spaces, not tabs: {line}"
 
-            # Check all help lines use spaces (no tabs)
-            for line in help_lines:
-                assert "\t" not in line, (
-                    f"Help text should use spaces, not tabs: {line}"
-                )
+        # Check lines are within limit
+        for line in help_lines:
+            assert len(line.rstrip("\n")) <= 80
 
-            # Check lines are within limit
-            for line in help_lines:
-                assert len(line.rstrip("\n")) <= 80
-        finally:
-            temp_path.unlink()
-
-    def test_reflow_hierarchical_indent(self):
+    def test_reflow_hierarchical_indent(self, espidf_config):
         """Test reflow with hierarchical indentation."""
-        config = LinterConfig.espidf_preset()
-        config.reflow_help_text = True
-        config.max_line_length = 70
-        linter = KconfigLinter(config)
+        linter = KconfigLinter(
+            replace(espidf_config, reflow_help_text=True, max_line_length=70)
+        )
 
         input_lines = [
             'menu "Test Menu"\n',
@@ -982,44 +624,34 @@ class TestHelpTextReflow:
             "endmenu\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(input_lines)
-            temp_path = Path(f.name)
+        formatted, _ = linter.format_lines(input_lines)
 
-        try:
-            formatted, _ = linter.format_file(temp_path)
+        # Find help text lines (after help keyword)
+        help_start = next(
+            i for i, line in enumerate(formatted) if line.strip() == "help"
+        )
+        help_lines = [
+            line
+            for line in formatted[help_start + 1 :]
+            if line.strip() and "endmenu" not in line
+        ]
 
-            # Find help text lines (after help keyword)
-            help_start = next(
-                i for i, line in enumerate(formatted) if line.strip() == "help"
+        # Verify indentation is correct (should be more than base level)
+        for line in help_lines:
+            # Should have significant indentation due to nesting
+            assert line.startswith("        "), (
+                f"Help text should be indented for nested item: {repr(line)}"
             )
-            help_lines = [
-                line
-                for line in formatted[help_start + 1 :]
-                if line.strip() and "endmenu" not in line
-            ]
 
-            # Verify indentation is correct (should be more than base level)
-            for line in help_lines:
-                # Should have significant indentation due to nesting
-                assert line.startswith("        "), (
-                    f"Help text should be indented for nested item: {repr(line)}"
-                )
+        # Check lines are within limit
+        for line in help_lines:
+            assert len(line.rstrip("\n")) <= 70
 
-            # Check lines are within limit
-            for line in help_lines:
-                assert len(line.rstrip("\n")) <= 70
-        finally:
-            temp_path.unlink()
-
-    def test_reflow_short_text(self):
+    def test_reflow_short_text(self, zephyr_config):
         """Test that short help text is not unnecessarily modified."""
-        config = LinterConfig.zephyr_preset()
-        config.reflow_help_text = True
-        config.max_line_length = 100
-        linter = KconfigLinter(config)
+        linter = KconfigLinter(
+            replace(zephyr_config, reflow_help_text=True, max_line_length=100)
+        )
 
         input_lines = [
             "config TEST\n",
@@ -1028,28 +660,17 @@ class TestHelpTextReflow:
             "\t  Short help.\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(input_lines)
-            temp_path = Path(f.name)
+        formatted, _ = linter.format_lines(input_lines)
 
-        try:
-            formatted, _ = linter.format_file(temp_path)
-
-            # Find help text line
-            help_line = [line for line in formatted if "Short help" in line][0]
+        # Find help text line
+        help_line = [line for line in formatted if "Short help" in line][0]
 
-            # Should be on a single line
-            assert "Short help." in help_line
-        finally:
-            temp_path.unlink()
+        # Should be on a single line
+        assert "Short help." in help_line
 
-    def test_reflow_disabled_by_default(self):
+    def test_reflow_disabled_by_default(self, zephyr_linter):
         """Test that reflow is disabled by default."""
-        config = LinterConfig.zephyr_preset()
         # reflow_help_text defaults to False
-        linter = KconfigLinter(config)
 
         input_lines = [
             "config TEST\n",
@@ -1058,31 +679,19 @@ class TestHelpTextReflow:
             "\t  This is a very long help text that would normally be reflowed if the option was enabled but should remain on one line.\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(input_lines)
-            temp_path = Path(f.name)
+        formatted, _ = zephyr_linter.format_lines(input_lines)
 
-        try:
-            formatted, _ = linter.format_file(temp_path)
+        # Find help text lines
+        help_lines = [line for line in formatted if "This is a very long" in line]
 
-            # Find help text lines
-            help_lines = [line for line in formatted if "This is a very long" in line]
+        # Should be on a single line (not reflowed)
+        assert len(help_lines) == 1, "Help text should not be reflowed when disabled"
 
-            # Should be on a single line (not reflowed)
-            assert len(help_lines) == 1, (
-                "Help text should not be reflowed when disabled"
-            )
-        finally:
-            temp_path.unlink()
-
-    def test_reflow_multiple_configs(self):
+    def test_reflow_multiple_configs(self, zephyr_config):
         """Test reflow with multiple config sections."""
-        config = LinterConfig.zephyr_preset()
-        config.reflow_help_text = True
-        config.max_line_length = 60
-        linter = KconfigLinter(config)
+        linter = KconfigLinter(
+            replace(zephyr_config, reflow_help_text=True, max_line_length=60)
+        )
 
         input_lines = [
             "config TEST1\n",
@@ -1096,34 +705,23 @@ class TestHelpTextReflow:
             "\t  Second config also with long help text.\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(input_lines)
-            temp_path = Path(f.name)
+        formatted, _ = linter.format_lines(input_lines)
 
-        try:
-            formatted, _ = linter.format_file(temp_path)
+        # Check all lines are within limit
+        for line in formatted:
+            if line.strip():  # Non-empty lines
+                assert len(line.rstrip("\n")) <= 60, f"Line too long: {line}"
 
-            # Check all lines are within limit
-            for line in formatted:
-                if line.strip():  # Non-empty lines
-                    assert len(line.rstrip("\n")) <= 60, f"Line too long: {line}"
-
-            # Should have both config sections
-            assert sum(1 for line in formatted if "config TEST" in line) == 2
-        finally:
-            temp_path.unlink()
+        # Should have both config sections
+        assert sum(1 for line in formatted if "config TEST" in line) == 2
 
 
 class TestContinuationLines:
     """Test continuation line handling with backslashes."""
 
-    def test_wrap_long_depends_on(self):
+    def test_wrap_long_depends_on(self, zephyr_config):
         """Test wrapping long depends on lines."""
-        config = LinterConfig.zephyr_preset()
-        config.max_line_length = 50
-        linter = KconfigLinter(config)
+        linter = KconfigLinter(replace(zephyr_config, max_line_length=50))
 
         input_lines = [
             "config TEST\n",
@@ -1131,44 +729,31 @@ class TestContinuationLines:
             "\tdepends on FOO && BAR && BAZ && QUX && VERY_LONG_NAME\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(input_lines)
-            temp_path = Path(f.name)
+        formatted, _ = linter.format_lines(input_lines)
 
-        try:
-            formatted, _ = linter.format_file(temp_path)
+        # Should have continuation lines
+        cont_lines = [
+            line
+            for line in formatted
+            if "\\" in line or ("&&" in line and "depends" not in line)
+        ]
+        assert len(cont_lines) > 0, f"Long depends should be split, got: {formatted}"
 
-            # Should have continuation lines
-            cont_lines = [
-                line
-                for line in formatted
-                if "\\" in line or ("&&" in line and "depends" not in line)
-            ]
-            assert len(cont_lines) > 0, (
-                f"Long depends should be split, got: {formatted}"
-            )
+        # First depends line should end with backslash
+        depends_line = [line for line in formatted if "depends" in line][0]
+        assert depends_line.rstrip().endswith("\\"), (
+            f"Continuation should end with backslash: {depends_line}"
+        )
 
-            # First depends line should end with backslash
-            depends_line = [line for line in formatted if "depends" in line][0]
-            assert depends_line.rstrip().endswith("\\"), (
-                f"Continuation should end with backslash: {depends_line}"
+        # All lines should be within limit
+        for line in formatted:
+            assert len(line.rstrip("\n")) <= 50, (
+                f"Line too long ({len(line.rstrip())}): {line}"
             )
 
-            # All lines should be within limit
-            for line in formatted:
-                assert len(line.rstrip("\n")) <= 50, (
-                    f"Line too long ({len(line.rstrip())}): {line}"
-                )
-        finally:
-            temp_path.unlink()
-
-    def test_join_existing_continuations(self):
+    def test_join_existing_continuations(self, zephyr_config):
         """Test that existing continuation lines are joined and reformatted."""
-        config = LinterConfig.zephyr_preset()
-        config.max_line_length = 100
-        linter = KconfigLinter(config)
+        linter = KconfigLinter(replace(zephyr_config, max_line_length=100))
 
         input_lines = [
             "config TEST\n",
@@ -1178,27 +763,16 @@ class TestContinuationLines:
             "\t\tC\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(input_lines)
-            temp_path = Path(f.name)
+        formatted, _ = linter.format_lines(input_lines)
 
-        try:
-            formatted, _ = linter.format_file(temp_path)
-
-            # Should be joined into single line (since it fits in 100 chars)
-            select_lines = [line for line in formatted if "select" in line]
-            assert len(select_lines) == 1, "Short continuation should be joined"
-            assert "\\" not in select_lines[0], "No backslash needed for short line"
-        finally:
-            temp_path.unlink()
+        # Should be joined into single line (since it fits in 100 chars)
+        select_lines = [line for line in formatted if "select" in line]
+        assert len(select_lines) == 1, "Short continuation should be joined"
+        assert "\\" not in select_lines[0], "No backslash needed for short line"
 
-    def test_wrap_if_statement(self):
+    def test_wrap_if_statement(self, zephyr_config):
         """Test wrapping long if statements."""
-        config = LinterConfig.zephyr_preset()
-        config.max_line_length = 40
-        linter = KconfigLinter(config)
+        linter = KconfigLinter(replace(zephyr_config, max_line_length=40))
 
         input_lines = [
             "if NETWORKING && WIFI_ENABLED && BLUETOOTH_SUPPORT\n",
@@ -1207,32 +781,21 @@ class TestContinuationLines:
             "endif\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(input_lines)
-            temp_path = Path(f.name)
-
-        try:
-            formatted, _ = linter.format_file(temp_path)
+        formatted, _ = linter.format_lines(input_lines)
 
-            # Should have continuation for if
-            if_lines = [
-                line
-                for line in formatted
-                if "if" in line.lower() and "endif" not in line.lower()
-            ]
-            assert any("\\" in line for line in if_lines), (
-                f"Long if should have continuation, got: {if_lines}"
-            )
-        finally:
-            temp_path.unlink()
+        # Should have continuation for if
+        if_lines = [
+            line
+            for line in formatted
+            if "if" in line.lower() and "endif" not in line.lower()
+        ]
+        assert any("\\" in line for line in if_lines), (
+            f"Long if should have continuation, got: {if_lines}"
+        )
 
-    def test_continuation_with_spaces(self):
+    def test_continuation_with_spaces(self, espidf_config):
         """Test continuation with space indentation."""
-        config = LinterConfig.espidf_preset()
-        config.max_line_length = 60
-        linter = KconfigLinter(config)
+        linter = KconfigLinter(replace(espidf_config, max_line_length=60))
 
         input_lines = [
             "config TEST_OPTION\n",
@@ -1240,29 +803,18 @@ class TestContinuationLines:
             "    depends on A && B && C && D && E && F\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(input_lines)
-            temp_path = Path(f.name)
-
-        try:
-            formatted, _ = linter.format_file(temp_path)
+        formatted, _ = linter.format_lines(input_lines)
 
-            # Should use spaces for continuation indent
-            cont_lines = [
-                line for line in formatted if "&&" in line and "depends" not in line
-            ]
-            for line in cont_lines:
-                assert "\t" not in line, "Continuation should use spaces"
-        finally:
-            temp_path.unlink()
+        # Should use spaces for continuation indent
+        cont_lines = [
+            line for line in formatted if "&&" in line and "depends" not in line
+        ]
+        for line in cont_lines:
+            assert "\t" not in line, "Continuation should use spaces"
 
-    def test_no_wrap_for_short_lines(self):
+    def test_no_wrap_for_short_lines(self, zephyr_config):
         """Test that short lines are not wrapped."""
-        config = LinterConfig.zephyr_preset()
-        config.max_line_length = 100
-        linter = KconfigLinter(config)
+        linter = KconfigLinter(replace(zephyr_config, max_line_length=100))
 
         input_lines = [
             "config TEST\n",
@@ -1270,27 +822,16 @@ class TestContinuationLines:
             "\tdepends on FOO && BAR\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(input_lines)
-            temp_path = Path(f.name)
+        formatted, _ = linter.format_lines(input_lines)
 
-        try:
-            formatted, _ = linter.format_file(temp_path)
-
-            # Should not have any backslashes
-            assert not any("\\" in line for line in formatted), (
-                "Short lines should not be wrapped"
-            )
-        finally:
-            temp_path.unlink()
+        # Should not have any backslashes
+        assert not any("\\" in line for line in formatted), (
+            "Short lines should not be wrapped"
+        )
 
-    def test_continuation_hierarchical_indent(self):
+    def test_continuation_hierarchical_indent(self, espidf_config):
         """Test continuation lines with hierarchical indentation."""
-        config = LinterConfig.espidf_preset()
-        config.max_line_length = 60
-        linter = KconfigLinter(config)
+        linter = KconfigLinter(replace(espidf_config, max_line_length=60))
 
         input_lines = [
             'menu "Test"\n',
@@ -1300,38 +841,26 @@ class TestContinuationLines:
             "endmenu\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(input_lines)
-            temp_path = Path(f.name)
-
-        try:
-            formatted, _ = linter.format_file(temp_path)
+        formatted, _ = linter.format_lines(input_lines)
 
-            # Find continuation lines
-            cont_lines = [
-                line for line in formatted if "&&" in line and "select" not in line
-            ]
+        # Find continuation lines
+        cont_lines = [
+            line for line in formatted if "&&" in line and "select" not in line
+        ]
 
-            # Should have proper hierarchical indentation
-            for line in cont_lines:
-                # Should be indented more than the base config level
-                assert line.startswith("        "), (
-                    f"Continuation should maintain hierarchy: {repr(line)}"
-                )
-        finally:
-            temp_path.unlink()
+        # Should have proper hierarchical indentation
+        for line in cont_lines:
+            # Should be indented more than the base config level
+            assert line.startswith("        "), (
+                f"Continuation should maintain hierarchy: {repr(line)}"
+            )
 
 
 class TestCommentIndentation:
     """Test comment line indentation."""
 
-    def test_comment_indentation_hierarchical(self):
+    def test_comment_indentation_hierarchical(self, espidf_linter):
         """Test that comments are indented with hierarchical style."""
-        config = LinterConfig.espidf_preset()
-        linter = KconfigLinter(config)
-
         input_lines = [
             'menu "Test"\n',
             "# Comment inside menu\n",
@@ -1341,37 +870,25 @@ class TestCommentIndentation:
             "# Comment outside menu\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(input_lines)
-            temp_path = Path(f.name)
+        formatted, _ = espidf_linter.format_lines(input_lines)
 
-        try:
-            formatted, _ = linter.format_file(temp_path)
+        # Find comment lines
+        inside_comment = [line for line in formatted if "Comment inside" in line][0]
+        outside_comment = [line for line in formatted if "Comment outside" in line][0]
 
-            # Find comment lines
-            inside_comment = [line for line in formatted if "Comment inside" in line][0]
-            outside_comment = [line for line in formatted if "Comment outside" in line][
-                0
-            ]
+        # Inside comment should be indented
+        assert inside_comment.startswith("    #"), (
+            f"Comment inside menu should be indented: {repr(inside_comment)}"
+        )
 
-            # Inside comment should be indented
-            assert inside_comment.startswith("    #"), (
-                f"Comment inside menu should be indented: {repr(inside_comment)}"
-            )
+        # Outside comment should not be indented
+        assert outside_comment.startswith("#") and not outside_comment.startswith(
+            " "
+        ), f"Comment outside menu should not be indented: {repr(outside_comment)}"
 
-            # Outside comment should not be indented
-            assert outside_comment.startswith("#") and not outside_comment.startswith(
-                " "
-            ), f"Comment outside menu should not be indented: {repr(outside_comment)}"
-        finally:
-            temp_path.unlink()
-
-    def test_comment_no_indent_without_hierarchical(self):
+    def test_comment_no_indent_without_hierarchical(self, zephyr_linter):
         """Test that comments are not indented without hierarchical style."""
-        config = LinterConfig.zephyr_preset()  # No hierarchical by default
-        linter = KconfigLinter(config)
+        # No hierarchical by default
 
         input_lines = [
             'menu "Test"\n',
@@ -1381,29 +898,19 @@ class TestCommentIndentation:
             "endmenu\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(input_lines)
-            temp_path = Path(f.name)
-
-        try:
-            formatted, _ = linter.format_file(temp_path)
+        formatted, _ = zephyr_linter.format_lines(input_lines)
 
-            # Find comment line
-            comment = [line for line in formatted if "Comment inside" in line][0]
+        # Find comment line
+        comment = [line for line in formatted if "Comment inside" in line][0]
 
-            # Comment should not be indented (Zephyr style, no hierarchy, not in config block)
-            assert comment.startswith("#") and not comment.startswith(" "), (
-                f"Comment should not be indented in Zephyr style: {repr(comment)}"
-            )
-        finally:
-            temp_path.unlink()
+        # Comment should not be indented (Zephyr style, no hierarchy, not in config block)
+        assert comment.startswith("#") and not comment.startswith(" "), (
+            f"Comment should not be indented in Zephyr style: {repr(comment)}"
+        )
 
-    def test_comment_in_config_block(self):
+    def test_comment_in_config_block(self, zephyr_linter):
         """Test that comments inside config blocks are always indented."""
-        config = LinterConfig.zephyr_preset()  # No hierarchical by default
-        linter = KconfigLinter(config)
+        # No hierarchical by default
 
         input_lines = [
             "config TEST\n",
@@ -1412,30 +919,18 @@ class TestCommentIndentation:
             "\tdefault y\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(input_lines)
-            temp_path = Path(f.name)
-
-        try:
-            formatted, _ = linter.format_file(temp_path)
+        formatted, _ = zephyr_linter.format_lines(input_lines)
 
-            # Find comment line
-            comment = [line for line in formatted if "Comment inside" in line][0]
+        # Find comment line
+        comment = [line for line in formatted if "Comment inside" in line][0]
 
-            # Comment should be indented like options (with tab in Zephyr style)
-            assert comment.startswith("\t#"), (
-                f"Comment in config block should be indented: {repr(comment)}"
-            )
-        finally:
-            temp_path.unlink()
+        # Comment should be indented like options (with tab in Zephyr style)
+        assert comment.startswith("\t#"), (
+            f"Comment in config block should be indented: {repr(comment)}"
+        )
 
-    def test_nested_comment_indentation(self):
+    def test_nested_comment_indentation(self, espidf_linter):
         """Test comment indentation in nested structures."""
-        config = LinterConfig.espidf_preset()
-        linter = KconfigLinter(config)
-
         input_lines = [
             'menu "Level 1"\n',
             "# Comment level 1\n",
@@ -1447,230 +942,144 @@ class TestCommentIndentation:
             "endmenu\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(input_lines)
-            temp_path = Path(f.name)
-
-        try:
-            formatted, _ = linter.format_file(temp_path)
-
-            # Find comment lines
-            level1_comment = [line for line in formatted if "level 1" in line][0]
-            level2_comment = [line for line in formatted if "level 2" in line][0]
-
-            # Level 1 should have 4 spaces
-            assert level1_comment.startswith("    #"), (
-                f"Level 1 comment should have 4 spaces: {repr(level1_comment)}"
-            )
-
-            # Level 2 should have 8 spaces
-            assert level2_comment.startswith("        #"), (
-                f"Level 2 comment should have 8 spaces: {repr(level2_comment)}"
-            )
-        finally:
-            temp_path.unlink()
-
+        formatted, _ = espidf_linter.format_lines(input_lines)
 
-class TestCLI:
-    """Test command-line interface."""
+        # Find comment lines
+        level1_comment = [line for line in formatted if "level 1" in line][0]
+        level2_comment = [line for line in formatted if "level 2" in line][0]
 
-    def test_cli_basic_lint(self):
-        """Test basic CLI linting."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.write('config TEST\n\tbool "Test"\n')
-            temp_path = Path(f.name)
-
-        try:
-            result = subprocess.run(
-                [sys.executable, "-m", "kconfigstyle", str(temp_path)],
-                cwd=Path(__file__).parent.parent,
-                capture_output=True,
-                text=True,
-            )
-            assert result.returncode == 0
-            assert "0 issue(s)" in result.stdout
-        finally:
-            temp_path.unlink()
-
-    def test_cli_with_issues(self):
-        """Test CLI with files that have issues."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.write("config TEST  \n")  # Trailing space
-            temp_path = Path(f.name)
-
-        try:
-            result = subprocess.run(
-                [sys.executable, "-m", "kconfigstyle", str(temp_path)],
-                cwd=Path(__file__).parent.parent,
-                capture_output=True,
-                text=True,
-            )
-            assert result.returncode == 1
-            assert "Trailing whitespace" in result.stdout
-        finally:
-            temp_path.unlink()
-
-    def test_cli_file_not_found(self):
-        """Test CLI with non-existent file."""
-        result = subprocess.run(
-            [sys.executable, "-m", "kconfigstyle", "/nonexistent/file.Kconfig"],
-            cwd=Path(__file__).parent.parent,
-            capture_output=True,
-            text=True,
+        # Level 1 should have 4 spaces
+        assert level1_comment.startswith("    #"), (
+            f"Level 1 comment should have 4 spaces: {repr(level1_comment)}"
         )
-        assert "File not found" in result.stderr
-
-    def test_cli_write_mode(self):
-        """Test CLI in write/format mode."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.write('#Bad comment\nconfig TEST\n  bool "Test"\n')
-            temp_path = Path(f.name)
-
-        try:
-            result = subprocess.run(
-                [sys.executable, "-m", "kconfigstyle", "--write", str(temp_path)],
-                cwd=Path(__file__).parent.parent,
-                capture_output=True,
-                text=True,
-            )
-            assert result.returncode == 0
-            assert "Formatted 1 file(s)" in result.stdout
-
-            # Verify file was actually formatted
-            with open(temp_path) as f:
-                content = f.read()
-                assert content.startswith("# Bad comment")
-                assert "\t" in content  # Should have tabs
-        finally:
-            temp_path.unlink()
-
-    def test_cli_espidf_preset(self):
-        """Test CLI with ESP-IDF preset."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.write('config lowercase\n    bool "Test"\n')
-            temp_path = Path(f.name)
-
-        try:
-            result = subprocess.run(
-                [
-                    sys.executable,
-                    "-m",
-                    "kconfigstyle",
-                    "--preset",
-                    "espidf",
-                    str(temp_path),
-                ],
-                cwd=Path(__file__).parent.parent,
-                capture_output=True,
-                text=True,
-            )
-            assert result.returncode == 1
-            assert "uppercase" in result.stdout
-        finally:
-            temp_path.unlink()
-
-    def test_cli_custom_options(self):
-        """Test CLI with custom options."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.write("# " + "x" * 60 + "\n")
-            temp_path = Path(f.name)
-
-        try:
-            result = subprocess.run(
-                [
-                    sys.executable,
-                    "-m",
-                    "kconfigstyle",
-                    "--max-line-length",
-                    "50",
-                    str(temp_path),
-                ],
-                cwd=Path(__file__).parent.parent,
-                capture_output=True,
-                text=True,
-            )
-            assert result.returncode == 1
-            assert "exceeds 50 characters" in result.stdout
-        finally:
-            temp_path.unlink()
 
-    def test_cli_verbose(self):
-        """Test CLI with verbose output."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.write('config TEST\n\tbool "Test"\n')
-            temp_path = Path(f.name)
+        # Level 2 should have 8 spaces
+        assert level2_comment.startswith("        #"), (
+            f"Level 2 comment should have 8 spaces: {repr(level2_comment)}"
+        )
 
-        try:
-            result = subprocess.run(
-                [sys.executable, "-m", "kconfigstyle", "--verbose", str(temp_path)],
-                cwd=Path(__file__).parent.parent,
-                capture_output=True,
-                text=True,
-            )
-            assert "Linting" in result.stdout
-        finally:
-            temp_path.unlink()
-
-    def test_cli_multiple_files(self):
-        """Test CLI with multiple files."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f1:
-            f1.write('config TEST1\n\tbool "Test"\n')
-            temp_path1 = Path(f1.name)
-
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f2:
-            f2.write('config TEST2\n\tbool "Test"\n')
-            temp_path2 = Path(f2.name)
 
-        try:
-            result = subprocess.run(
-                [
-                    sys.executable,
-                    "-m",
-                    "kconfigstyle",
-                    str(temp_path1),
-                    str(temp_path2),
-                ],
-                cwd=Path(__file__).parent.parent,
-                capture_output=True,
-                text=True,
-            )
-            assert result.returncode == 0
-        finally:
-            temp_path1.unlink()
-            temp_path2.unlink()
+class TestCLI:
+    """Test command-line interface."""
+
+    def test_cli_basic_lint(self, kconfig_test_file):
+        """Test basic CLI linting."""
+        result = subprocess.run(
+            [*_PY_CLI, str(kconfig_test_file)],
+            cwd=_REPO_ROOT,
+            capture_output=True,
+            close_fds=False,
+            timeout=30,
+        )
+        assert result.returncode == 0
+        assert b"0 issue(s)" in result.stdout
+
+    def test_cli_module_entry_point(
+        self, monkeypatch, capsys, kconfig_trailing_space_file
+    ):
+        """Test running the package as a module, in-process."""
+        monkeypatch.setattr(
+            sys, "argv", ["kconfigstyle", str(kconfig_trailing_space_file)]
+        )
 
-    def test_cli_all_options(self):
-        """Test CLI with all available options."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.write('config TEST\nbool "Test"\n')
-            temp_path = Path(f.name)
+        with pytest.raises(SystemExit) as exc_info:
+            runpy.run_module("kconfigstyle", run_name="__main__")
+
+        assert exc_info.value.code == 1
+        assert "Trailing whitespace" in capsys.readouterr().out
+
+    @pytest.mark.parametrize(
+        ("input_file", "extra_args", "expected"),
+        [
+            ("kconfig_trailing_space_file", [], "Trailing whitespace"),
+            ("kconfig_lowercase_file", ["--preset", "espidf"], "uppercase"),
+            (
+                "kconfig_longline_file",
+                ["--max-line-length", "50"],
+                "exceeds 50 characters",
+            ),
+        ],
+        ids=["trailing-whitespace", "espidf-preset", "custom-line-length"],
+    )
+    def test_cli_with_issues(
+        self, request, cli_runner, input_file, extra_args, expected
+    ):
+        """Test CLI with files that have issues."""
+        result = cli_runner([*extra_args, request.getfixturevalue(input_file)])
+        assert result.returncode == 1
+        assert expected in result.stdout
 
-        try:
-            result = subprocess.run(
+    def test_cli_file_not_found(self, cli_runner):
+        """Test CLI with non-existent file."""
+        result = cli_runner(["/nonexistent/file.Kconfig"])
+        assert "File not found" in result.stderr
+
+    def test_cli_write_mode(self, tmp_path, cli_runner):
+        """Test CLI in write/format mode."""
+        temp_path = tmp_path / "Kconfig"
+        temp_path.write_bytes(b'#Bad comment\nconfig TEST\n  bool "Test"\n')
+
+        result = cli_runner(["--write", str(temp_path)])
+        assert result.returncode == 0
+        assert "Formatted 1 file(s)" in result.stdout
+
+        # Verify file was actually formatted
+        with open(temp_path) as f:
+            content = f.read()
+            assert content.startswith("# Bad comment")
+            assert "\t" in content  # Should have tabs
+
+    def test_cli_multiple_files(self, tmp_path, cli_runner):
+        """Test CLI with multiple well-formed files in one invocation."""
+        paths = []
+        for i in range(1, 4):
+            path = tmp_path / f"Kconfig{i}"
+            path.write_bytes(b'config TEST%d\n\tbool "Test"\n' % i)
+            paths.append(path)
+
+        result = cli_runner(["--verbose", *paths])
+        assert result.returncode == 0
+        for path in paths:
+            assert f"Linting {path}" in result.stdout
+        assert "Total: 0 issue(s) in 0 file(s)" in result.stdout
+
+    @pytest.mark.parametrize(
+        ("flags", "content", "expected"),
+        [
+            pytest.param(
+                ["--use-spaces", "--primary-indent", "2"],
+                SNIPPET_NOINDENT,
+                b'\n  bool "Test"\n',
+                id="use-spaces",
+            ),
+            pytest.param(
+                ["--help-indent", "4"],
+                b'config TEST\n\tbool "Test"\n\thelp\n\t  Some help.\n',
+                b"\n\t    Some help.\n",
+                id="help-indent",
+            ),
+            pytest.param(
+                ["--indent-sub-items"],
+                b'menu "M"\nconfig TEST\nbool "Test"\nendmenu\n',
+                b'\n\tconfig TEST\n\t\tbool "Test"\n',
+                id="indent-sub-items",
+            ),
+            pytest.param(
+                ["--consolidate-empty-lines"],
+                b'config A\n\tbool "A"\n\n\n\nconfig B\n\tbool "B"\n',
+                b'\tbool "A"\n\nconfig B\n',
+                id="consolidate-empty-lines",
+            ),
+            pytest.param(
+                ["--reflow-help"],
+                b'config TEST\n\tbool "Test"\n\thelp\n\t  '
+                + b" ".join([b"word"] * 25)
+                + b"\n",
+                b"\n\t  word word word word word word\n",
+                id="reflow-help",
+            ),
+            pytest.param(
                 [
-                    sys.executable,
-                    "-m",
-                    "kconfigstyle",
                     "--use-spaces",
                     "--primary-indent",
                     "2",
@@ -1686,67 +1095,106 @@ class TestCLI:
                     "--indent-sub-items",
                     "--consolidate-empty-lines",
                     "--reflow-help",
-                    "--write",
                     "--verbose",
-                    str(temp_path),
                 ],
-                cwd=Path(__file__).parent.parent,
-                capture_output=True,
-                text=True,
-            )
-            assert "Formatted" in result.stdout
-        finally:
-            temp_path.unlink()
-
-    def test_cli_reflow_help(self):
+                SNIPPET_NOINDENT,
+                b'\n  bool "Test"\n',
+                id="all",
+            ),
+        ],
+    )
+    def test_cli_format_options(self, tmp_path, cli_runner, flags, content, expected):
+        """Test that each formatting option changes the written file."""
+        default_path = tmp_path / "Kconfig.default"
+        default_path.write_bytes(content)
+        temp_path = tmp_path / "Kconfig"
+        temp_path.write_bytes(content)
+
+        cli_runner(["--write", default_path])
+        result = cli_runner([*flags, "--write", temp_path])
+        assert result.returncode == 0
+        assert "Formatted 1 file(s)" in result.stdout
+        assert expected in temp_path.read_bytes()
+        assert expected not in default_path.read_bytes()
+
+    @pytest.mark.parametrize(
+        ("flags", "content", "expected"),
+        [
+            pytest.param(
+                ["--max-line-length", "120"],
+                b"# " + b"x" * 108 + b"\n",
+                "Total: 0 issue(s)",
+                id="max-line-length",
+            ),
+            pytest.param(
+                ["--max-option-length", "10"],
+                b'config ABCDEFGHIJKLMNOP\n\tbool "Test"\n',
+                "Config name exceeds 10 characters",
+                id="max-option-length",
+            ),
+            pytest.param(
+                ["--uppercase-configs"],
+                b'config lowercase\n\tbool "Test"\n',
+                "must be uppercase",
+                id="uppercase-configs",
+            ),
+            pytest.param(
+                ["--min-prefix-length", "4"],
+                b'config ABC_TEST\n\tbool "Test"\n',
+                "prefix should be at least 4 characters",
+                id="min-prefix-length",
+            ),
+            pytest.param(
+                ["--verbose"],
+                SNIPPET_UPPER,
+                "Linting",
+                id="verbose",
+            ),
+        ],
+    )
+    def test_cli_lint_options(self, tmp_path, cli_runner, flags, content, expected):
+        """Test that each lint option changes the reported issues."""
+        temp_path = tmp_path / "Kconfig"
+        temp_path.write_bytes(content)
+
+        assert expected not in cli_runner([temp_path]).stdout
+        assert expected in cli_runner([*flags, temp_path]).stdout
+
+    def test_cli_reflow_help(self, tmp_path, cli_runner):
         """Test CLI with reflow help option."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.write(
-                'config TEST\n\tbool "Test"\n\thelp\n\t  This is a very long help text that should be reflowed to fit within the specified maximum line length when using the reflow option.\n'
-            )
-            temp_path = Path(f.name)
+        temp_path = tmp_path / "Kconfig"
+        temp_path.write_bytes(
+            b'config TEST\n\tbool "Test"\n\thelp\n\t  This is a very long help text that should be reflowed to fit within the specified maximum line length when using the reflow option.\n'
+        )
 
-        try:
-            result = subprocess.run(
-                [
-                    sys.executable,
-                    "-m",
-                    "kconfigstyle",
-                    "--reflow-help",
-                    "--max-line-length",
-                    "60",
-                    "--write",
-                    str(temp_path),
-                ],
-                cwd=Path(__file__).parent.parent,
-                capture_output=True,
-                text=True,
-            )
-            assert result.returncode == 0
-            assert "Formatted" in result.stdout
-
-            # Verify file was reflowed
-            with open(temp_path) as f:
-                content = f.read()
-                lines = content.split("\n")
-                # All non-empty lines should be within limit
-                for line in lines:
-                    if line.strip():
-                        assert len(line) <= 60, f"Line too long: {line}"
-        finally:
-            temp_path.unlink()
+        result = cli_runner(
+            [
+                "--reflow-help",
+                "--max-line-length",
+                "60",
+                "--write",
+                str(temp_path),
+            ]
+        )
+        assert result.returncode == 0
+        assert "Formatted" in result.stdout
+
+        # Verify file was reflowed
+        with open(temp_path) as f:
+            content = f.read()
+            lines = content.split("\n")
+            # All non-empty lines should be within limit
+            for line in lines:
+                if line.strip():
+                    assert len(line) <= 60, f"Line too long: {line}"
 
 
 class TestHelpBlockTermination:
     """Test help block termination and keyword detection."""
 
-    def test_blank_line_terminates_help(self):
+    def test_blank_line_terminates_help(self, zephyr_config):
         """Test that blank lines terminate help blocks."""
-        config = LinterConfig.zephyr_preset()
-        config.reflow_help_text = True
-        linter = KconfigLinter(config)
+        linter = KconfigLinter(replace(zephyr_config, reflow_help_text=True))
 
         lines = [
             "config TEST\n",
@@ -1758,27 +1206,16 @@ class TestHelpBlockTermination:
             'source "Kconfig.test"\n',
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
+        formatted_lines, _ = linter.format_lines(lines)
+        formatted = "".join(formatted_lines)
 
-        try:
-            formatted_lines, _ = linter.format_file(temp_path)
-            formatted = "".join(formatted_lines)
-
-            # After the blank line, module and source should be at top level (not indented)
-            assert "\nmodule = TEST\n" in formatted
-            assert '\nsource "Kconfig.test"\n' in formatted
-        finally:
-            temp_path.unlink()
+        # After the blank line, module and source should be at top level (not indented)
+        assert "\nmodule = TEST\n" in formatted
+        assert '\nsource "Kconfig.test"\n' in formatted
 
-    def test_config_keyword_in_help_text(self):
+    def test_config_keyword_in_help_text(self, zephyr_config):
         """Test that 'config' in help text is not treated as a keyword."""
-        config = LinterConfig.zephyr_preset()
-        config.reflow_help_text = True
-        linter = KconfigLinter(config)
+        linter = KconfigLinter(replace(zephyr_config, reflow_help_text=True))
 
         lines = [
             "config MEMFAULT_TEST\n",
@@ -1788,28 +1225,17 @@ class TestHelpBlockTermination:
             "\t  config header.\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
-
-        try:
-            formatted_lines, _ = linter.format_file(temp_path)
-            formatted = "".join(formatted_lines)
+        formatted_lines, _ = linter.format_lines(lines)
+        formatted = "".join(formatted_lines)
 
-            # "config header." should be reflowed as part of help text, not treated as keyword
-            assert "config header" in formatted
-            # Should be a single reflowed paragraph
-            assert formatted.count("\t  ") == 1  # Only one help text line
-        finally:
-            temp_path.unlink()
+        # "config header." should be reflowed as part of help text, not treated as keyword
+        assert "config header" in formatted
+        # Should be a single reflowed paragraph
+        assert formatted.count("\t  ") == 1  # Only one help text line
 
-    def test_module_keyword_in_help_text(self):
+    def test_module_keyword_in_help_text(self, zephyr_config):
         """Test that 'module' assignments in help text are treated as help content."""
-        config = LinterConfig.zephyr_preset()
-        config.reflow_help_text = False
-        linter = KconfigLinter(config)
+        linter = KconfigLinter(replace(zephyr_config, reflow_help_text=False))
 
         lines = [
             "config TEST\n",
@@ -1822,27 +1248,15 @@ class TestHelpBlockTermination:
             'source "test.Kconfig"\n',
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
-
-        try:
-            formatted_lines, _ = linter.format_file(temp_path)
-            formatted = "".join(formatted_lines)
+        formatted_lines, _ = linter.format_lines(lines)
+        formatted = "".join(formatted_lines)
 
-            # After blank line terminates help, unindented module lines should be top-level
-            assert "\nmodule = MEMFAULT\n" in formatted
-            assert "\nmodule-str = Memfault\n" in formatted
-        finally:
-            temp_path.unlink()
+        # After blank line terminates help, unindented module lines should be top-level
+        assert "\nmodule = MEMFAULT\n" in formatted
+        assert "\nmodule-str = Memfault\n" in formatted
 
-    def test_blank_line_with_indented_continuation(self):
+    def test_blank_line_with_indented_continuation(self, zephyr_linter):
         """Test that blank lines in help text followed by indented text continue the help block."""
-        config = LinterConfig.zephyr_preset()
-        linter = KconfigLinter(config)
-
         lines = [
             "config CACHE_DOUBLEMAP\n",
             '\tbool "Cache double-mapping support"\n',
@@ -1856,23 +1270,14 @@ class TestHelpBlockTermination:
             "\t  sense when MP_MAX_NUM_CPUS > 1.\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
+        formatted_lines, _ = zephyr_linter.format_lines(lines)
+        formatted = "".join(formatted_lines)
 
-        try:
-            formatted_lines, _ = linter.format_file(temp_path)
-            formatted = "".join(formatted_lines)
-
-            # The blank line should be preserved
-            assert "\n\n" in formatted
-            # Text after blank line should still be formatted as help text (indented)
-            assert "\t  This applies to" in formatted
-            assert "\t  sense when MP_MAX_NUM_CPUS > 1.\n" in formatted
-        finally:
-            temp_path.unlink()
+        # The blank line should be preserved
+        assert "\n\n" in formatted
+        # Text after blank line should still be formatted as help text (indented)
+        assert "\t  This applies to" in formatted
+        assert "\t  sense when MP_MAX_NUM_CPUS > 1.\n" in formatted
 
     def test_config_keyword_as_indented_help_text(self):
         """Test that indented 'config' keyword is treated as help text, not a new config."""
@@ -1913,11 +1318,8 @@ class TestHelpBlockTermination:
         assert help_text.lines[2] == ""
         assert help_text.lines[3] == "config use this config!"
 
-    def test_inline_comments_preserved(self):
+    def test_inline_comments_preserved(self, zephyr_linter):
         """Test that inline comments are preserved during formatting."""
-        config = LinterConfig.zephyr_preset()
-        linter = KconfigLinter(config)
-
         lines = [
             "config TEST  # Test configuration\n",
             '\tbool "Enable test"  # Boolean option\n',
@@ -1942,43 +1344,32 @@ class TestHelpBlockTermination:
             "endmenu  # Test Menu\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
+        formatted, _ = zephyr_linter.format_lines(lines)
+        formatted_text = "".join(formatted)
 
-        try:
-            formatted, _ = linter.format_file(temp_path)
-            formatted_text = "".join(formatted)
-
-            # Check that inline comments are preserved
-            assert "# Test configuration" in formatted_text
-            assert "# Boolean option" in formatted_text
-            assert "# Default to enabled" in formatted_text
-            assert "# Feature flag" in formatted_text
-            assert "endif  # FEATURE" in formatted_text
-            assert "# Test choice" in formatted_text
-            assert "endchoice  # TEST_CHOICE" in formatted_text
-            assert "# Menu for testing" in formatted_text
-            assert "endmenu  # Test Menu" in formatted_text
-
-            # Verify proper spacing before comments (2 spaces)
-            assert "config TEST  # Test configuration" in formatted_text
-            assert 'bool "Enable test"  # Boolean option' in formatted_text
-            assert "default y  # Default to enabled" in formatted_text
-        finally:
-            temp_path.unlink()
+        # Check that inline comments are preserved
+        assert "# Test configuration" in formatted_text
+        assert "# Boolean option" in formatted_text
+        assert "# Default to enabled" in formatted_text
+        assert "# Feature flag" in formatted_text
+        assert "endif  # FEATURE" in formatted_text
+        assert "# Test choice" in formatted_text
+        assert "endchoice  # TEST_CHOICE" in formatted_text
+        assert "# Menu for testing" in formatted_text
+        assert "endmenu  # Test Menu" in formatted_text
+
+        # Verify proper spacing before comments (2 spaces)
+        assert "config TEST  # Test configuration" in formatted_text
+        assert 'bool "Enable test"  # Boolean option' in formatted_text
+        assert "default y  # Default to enabled" in formatted_text
 
 
 class TestAdditionalCoverage:
     """Additional tests to improve code coverage."""
 
-    def test_help_with_spaces_hierarchical_blank_line(self):
+    def test_help_with_spaces_hierarchical_blank_line(self, espidf_config):
         """Test help text with blank line using spaces and hierarchical indenting."""
-        config = LinterConfig.espidf_preset()
-        config.indent_sub_items = True
-        linter = KconfigLinter(config)
+        linter = KconfigLinter(replace(espidf_config, indent_sub_items=True))
 
         lines = [
             'menu "Test"\n',
@@ -1990,28 +1381,17 @@ class TestAdditionalCoverage:
             "            Second paragraph.\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
+        formatted_lines, _ = linter.format_lines(lines)
+        formatted = "".join(formatted_lines)
 
-        try:
-            formatted_lines, _ = linter.format_file(temp_path)
-            formatted = "".join(formatted_lines)
-
-            # Both paragraphs should be indented properly
-            assert "            First paragraph." in formatted
-            assert "            Second paragraph." in formatted
-            assert "\n\n" in formatted  # Blank line preserved
-        finally:
-            temp_path.unlink()
+        # Both paragraphs should be indented properly
+        assert "            First paragraph." in formatted
+        assert "            Second paragraph." in formatted
+        assert "\n\n" in formatted  # Blank line preserved
 
-    def test_comment_after_help_with_blank_reflow(self):
+    def test_comment_after_help_with_blank_reflow(self, zephyr_config):
         """Test comment after help block with blank line and reflow enabled."""
-        config = LinterConfig.zephyr_preset()
-        config.reflow_help_text = True
-        linter = KconfigLinter(config)
+        linter = KconfigLinter(replace(zephyr_config, reflow_help_text=True))
 
         lines = [
             "config TEST\n",
@@ -2023,27 +1403,17 @@ class TestAdditionalCoverage:
             "config NEXT\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
-
-        try:
-            formatted_lines, _ = linter.format_file(temp_path)
-            formatted = "".join(formatted_lines)
+        formatted_lines, _ = linter.format_lines(lines)
+        formatted = "".join(formatted_lines)
 
-            # Comment should be at top level
-            assert "\n# Comment here\n" in formatted
-        finally:
-            temp_path.unlink()
+        # Comment should be at top level
+        assert "\n# Comment here\n" in formatted
 
-    def test_help_text_indentation_mismatch_with_reflow(self):
+    def test_help_text_indentation_mismatch_with_reflow(self, espidf_config):
         """Test help block ending when indentation doesn't match (with reflow)."""
-        config = LinterConfig.espidf_preset()
-        config.reflow_help_text = True
-        config.indent_sub_items = True
-        linter = KconfigLinter(config)
+        linter = KconfigLinter(
+            replace(espidf_config, reflow_help_text=True, indent_sub_items=True)
+        )
 
         lines = [
             'menu "Test"\n',
@@ -2055,26 +1425,14 @@ class TestAdditionalCoverage:
             "    config NEXT\n",  # Different indentation - ends help
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
-
-        try:
-            formatted_lines, _ = linter.format_file(temp_path)
-            formatted = "".join(formatted_lines)
+        formatted_lines, _ = linter.format_lines(lines)
+        formatted = "".join(formatted_lines)
 
-            # NEXT should be properly formatted, not as help text
-            assert "    config NEXT\n" in formatted
-        finally:
-            temp_path.unlink()
+        # NEXT should be properly formatted, not as help text
+        assert "    config NEXT\n" in formatted
 
-    def test_continuation_lines_multiple(self):
+    def test_continuation_lines_multiple(self, zephyr_linter):
         """Test multiple continuation lines."""
-        config = LinterConfig.zephyr_preset()
-        linter = KconfigLinter(config)
-
         lines = [
             "config TEST\n",
             '\tbool "Test"\n',
@@ -2083,26 +1441,15 @@ class TestAdditionalCoverage:
             "\t           C\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
-
-        try:
-            formatted_lines, _ = linter.format_file(temp_path)
-            formatted = "".join(formatted_lines)
+        formatted_lines, _ = zephyr_linter.format_lines(lines)
+        formatted = "".join(formatted_lines)
 
-            # Should join continuation lines
-            assert "depends on A && B && C" in formatted
-        finally:
-            temp_path.unlink()
+        # Should join continuation lines
+        assert "depends on A && B && C" in formatted
 
-    def test_reflow_empty_line_in_paragraph(self):
+    def test_reflow_empty_line_in_paragraph(self, zephyr_config):
         """Test reflow with empty lines creating paragraphs."""
-        config = LinterConfig.zephyr_preset()
-        config.reflow_help_text = True
-        linter = KconfigLinter(config)
+        linter = KconfigLinter(replace(zephyr_config, reflow_help_text=True))
 
         lines = [
             "config TEST\n",
@@ -2114,35 +1461,23 @@ class TestAdditionalCoverage:
             "\t  Second para.\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
+        formatted_lines, _ = linter.format_lines(lines)
+        formatted = "".join(formatted_lines)
 
-        try:
-            formatted_lines, _ = linter.format_file(temp_path)
-            formatted = "".join(formatted_lines)
-
-            # Should have two separate paragraphs
-            lines_list = formatted.split("\n")
-            help_lines = [
-                line
-                for line in lines_list
-                if line.strip()
-                and not line.strip().startswith(("config", "bool", "help"))
-            ]
+        # Should have two separate paragraphs
+        lines_list = formatted.split("\n")
+        help_lines = [
+            line
+            for line in lines_list
+            if line.strip() and not line.strip().startswith(("config", "bool", "help"))
+        ]
 
-            # Should have reflowed paragraphs
-            assert len(help_lines) >= 2
-        finally:
-            temp_path.unlink()
+        # Should have reflowed paragraphs
+        assert len(help_lines) >= 2
 
-    def test_help_text_indentation_spaces_hierarchical(self):
+    def test_help_text_indentation_spaces_hierarchical(self, espidf_config):
         """Test help text indentation calculation with spaces and hierarchy."""
-        config = LinterConfig.espidf_preset()
-        config.indent_sub_items = True
-        linter = KconfigLinter(config)
+        linter = KconfigLinter(replace(espidf_config, indent_sub_items=True))
 
         lines = [
             "if ADVANCED\n",
@@ -2155,27 +1490,15 @@ class TestAdditionalCoverage:
             "                More help.\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
-
-        try:
-            formatted_lines, _ = linter.format_file(temp_path)
-            formatted = "".join(formatted_lines)
+        formatted_lines, _ = linter.format_lines(lines)
+        formatted = "".join(formatted_lines)
 
-            # Both help lines should have proper indentation
-            assert "                Help text." in formatted
-            assert "                More help." in formatted
-        finally:
-            temp_path.unlink()
+        # Both help lines should have proper indentation
+        assert "                Help text." in formatted
+        assert "                More help." in formatted
 
-    def test_unindented_other_line_ends_config_block(self):
+    def test_unindented_other_line_ends_config_block(self, zephyr_linter):
         """Test that unindented non-keyword lines end config blocks."""
-        config = LinterConfig.zephyr_preset()
-        linter = KconfigLinter(config)
-
         lines = [
             "config TEST\n",
             '\tbool "Test"\n',
@@ -2184,27 +1507,21 @@ class TestAdditionalCoverage:
             "config NEXT\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
-
-        try:
-            formatted_lines, _ = linter.format_file(temp_path)
-            formatted = "".join(formatted_lines)
+        formatted_lines, _ = zephyr_linter.format_lines(lines)
+        formatted = "".join(formatted_lines)
 
-            # some_other_line should be at top level
-            assert "\nsome_other_line\n" in formatted
-        finally:
-            temp_path.unlink()
+        # some_other_line should be at top level
+        assert "\nsome_other_line\n" in formatted
 
-    def test_reflow_narrow_width(self):
+    def test_reflow_narrow_width(self, zephyr_config):
         """Test reflow with very narrow available width."""
-        config = LinterConfig.zephyr_preset()
-        config.reflow_help_text = True
-        config.max_line_length = 30  # Very short
-        linter = KconfigLinter(config)
+        linter = KconfigLinter(
+            replace(
+                zephyr_config,
+                reflow_help_text=True,
+                max_line_length=30,  # Very short
+            )
+        )
 
         lines = [
             "config T\n",
@@ -2213,24 +1530,12 @@ class TestAdditionalCoverage:
             "\t  Short.\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
-
-        try:
-            formatted_lines, _ = linter.format_file(temp_path)
-            # Should handle narrow width gracefully
-            assert formatted_lines is not None
-        finally:
-            temp_path.unlink()
+        formatted_lines, _ = linter.format_lines(lines)
+        # Should handle narrow width gracefully
+        assert formatted_lines is not None
 
-    def test_help_block_ending_with_option(self):
+    def test_help_block_ending_with_option(self, zephyr_linter):
         """Test that option lines don't end config block when help ends."""
-        config = LinterConfig.zephyr_preset()
-        linter = KconfigLinter(config)
-
         lines = [
             "config TEST\n",
             '\tbool "Test"\n',
@@ -2240,26 +1545,14 @@ class TestAdditionalCoverage:
             "\tdefault y\n",  # option line after help
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
-
-        try:
-            formatted_lines, _ = linter.format_file(temp_path)
-            formatted = "".join(formatted_lines)
+        formatted_lines, _ = zephyr_linter.format_lines(lines)
+        formatted = "".join(formatted_lines)
 
-            # default should still be indented (in config block)
-            assert "\tdefault y\n" in formatted
-        finally:
-            temp_path.unlink()
+        # default should still be indented (in config block)
+        assert "\tdefault y\n" in formatted
 
-    def test_rsource_keyword(self):
+    def test_rsource_keyword(self, zephyr_linter):
         """Test rsource keyword handling."""
-        config = LinterConfig.zephyr_preset()
-        linter = KconfigLinter(config)
-
         lines = [
             "config TEST\n",
             '\tbool "Test"\n',
@@ -2269,26 +1562,14 @@ class TestAdditionalCoverage:
             'rsource "Kconfig.other"\n',
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
-
-        try:
-            formatted_lines, _ = linter.format_file(temp_path)
-            formatted = "".join(formatted_lines)
+        formatted_lines, _ = zephyr_linter.format_lines(lines)
+        formatted = "".join(formatted_lines)
 
-            # rsource should be at top level and end help block
-            assert '\nrsource "Kconfig.other"\n' in formatted
-        finally:
-            temp_path.unlink()
+        # rsource should be at top level and end help block
+        assert '\nrsource "Kconfig.other"\n' in formatted
 
-    def test_help_keyword_ends_help_block(self):
+    def test_help_keyword_ends_help_block(self, zephyr_linter):
         """Test that help keyword after blank ends help block."""
-        config = LinterConfig.zephyr_preset()
-        linter = KconfigLinter(config)
-
         lines = [
             "config TEST\n",
             '\tbool "Test"\n',
@@ -2298,26 +1579,14 @@ class TestAdditionalCoverage:
             "\thelp\n",  # Another help keyword
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
-
-        try:
-            formatted_lines, _ = linter.format_file(temp_path)
-            formatted = "".join(formatted_lines)
+        formatted_lines, _ = zephyr_linter.format_lines(lines)
+        formatted = "".join(formatted_lines)
 
-            # Should handle gracefully
-            assert "help" in formatted
-        finally:
-            temp_path.unlink()
+        # Should handle gracefully
+        assert "help" in formatted
 
-    def test_multiple_empty_lines_in_help_text(self):
+    def test_multiple_empty_lines_in_help_text(self, zephyr_linter):
         """Test that multiple consecutive empty lines in help text are consolidated."""
-        config = LinterConfig.zephyr_preset()
-        linter = KconfigLinter(config)
-
         lines = [
             "config TEST\n",
             '\tbool "Test"\n',
@@ -2329,29 +1598,18 @@ class TestAdditionalCoverage:
             "\t  Second line after multiple blanks.\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
+        # Verify formatted output has only one blank line
+        formatted_lines, _ = zephyr_linter.format_lines(lines)
+        formatted = "".join(formatted_lines)
 
-        try:
-            # Verify formatted output has only one blank line
-            formatted_lines, _ = linter.format_file(temp_path)
-            formatted = "".join(formatted_lines)
-
-            # Should not have multiple consecutive blank lines (3+ newlines in a row)
-            assert "\n\n\n" not in formatted
-            # Should have one blank line between help text paragraphs
-            assert "First line of help.\n\n\t  Second line" in formatted
-        finally:
-            temp_path.unlink()
+        # Should not have multiple consecutive blank lines (3+ newlines in a row)
+        assert "\n\n\n" not in formatted
+        # Should have one blank line between help text paragraphs
+        assert "First line of help.\n\n\t  Second line" in formatted
 
-    def test_comment_outside_config_hierarchical_with_tabs(self):
+    def test_comment_outside_config_hierarchical_with_tabs(self, zephyr_config):
         """Test comment outside config block with hierarchical indent using tabs."""
-        config = LinterConfig.zephyr_preset()
-        config.indent_sub_items = True
-        linter = KconfigLinter(config)
+        linter = KconfigLinter(replace(zephyr_config, indent_sub_items=True))
 
         lines = [
             'menu "Test"\n',
@@ -2361,26 +1619,15 @@ class TestAdditionalCoverage:
             "endmenu\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
-
-        try:
-            formatted_lines, _ = linter.format_file(temp_path)
-            formatted = "".join(formatted_lines)
+        formatted_lines, _ = linter.format_lines(lines)
+        formatted = "".join(formatted_lines)
 
-            # Comment should be indented with menu hierarchy
-            assert "\t# Comment in menu\n" in formatted
-        finally:
-            temp_path.unlink()
+        # Comment should be indented with menu hierarchy
+        assert "\t# Comment in menu\n" in formatted
 
-    def test_comment_outside_config_hierarchical_with_spaces(self):
+    def test_comment_outside_config_hierarchical_with_spaces(self, espidf_config):
         """Test comment outside config block with hierarchical indent using spaces."""
-        config = LinterConfig.espidf_preset()
-        config.indent_sub_items = True
-        linter = KconfigLinter(config)
+        linter = KconfigLinter(replace(espidf_config, indent_sub_items=True))
 
         lines = [
             'menu "Test"\n',
@@ -2390,26 +1637,15 @@ class TestAdditionalCoverage:
             "endmenu\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
+        formatted_lines, _ = linter.format_lines(lines)
+        formatted = "".join(formatted_lines)
 
-        try:
-            formatted_lines, _ = linter.format_file(temp_path)
-            formatted = "".join(formatted_lines)
-
-            # Comment should be indented with menu hierarchy
-            assert "    # Comment in menu\n" in formatted
-        finally:
-            temp_path.unlink()
+        # Comment should be indented with menu hierarchy
+        assert "    # Comment in menu\n" in formatted
 
-    def test_endmenu_with_spaces_hierarchical(self):
+    def test_endmenu_with_spaces_hierarchical(self, espidf_config):
         """Test endmenu indentation with spaces and hierarchical indent."""
-        config = LinterConfig.espidf_preset()
-        config.indent_sub_items = True
-        linter = KconfigLinter(config)
+        linter = KconfigLinter(replace(espidf_config, indent_sub_items=True))
 
         lines = [
             "if ADVANCED\n",
@@ -2420,26 +1656,15 @@ class TestAdditionalCoverage:
             "endif\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
-
-        try:
-            formatted_lines, _ = linter.format_file(temp_path)
-            formatted = "".join(formatted_lines)
+        formatted_lines, _ = linter.format_lines(lines)
+        formatted = "".join(formatted_lines)
 
-            # endmenu should be indented at if level
-            assert "    endmenu\n" in formatted
-        finally:
-            temp_path.unlink()
+        # endmenu should be indented at if level
+        assert "    endmenu\n" in formatted
 
-    def test_wrap_continuation_with_spaces(self):
+    def test_wrap_continuation_with_spaces(self, espidf_config):
         """Test wrapping long lines with continuations using spaces."""
-        config = LinterConfig.espidf_preset()
-        config.max_line_length = 50
-        linter = KconfigLinter(config)
+        linter = KconfigLinter(replace(espidf_config, max_line_length=50))
 
         lines = [
             "config TEST\n",
@@ -2447,26 +1672,15 @@ class TestAdditionalCoverage:
             "    depends on AAAAAAAA && BBBBBBBB && CCCCCCCC\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
-
-        try:
-            formatted_lines, _ = linter.format_file(temp_path)
-            formatted = "".join(formatted_lines)
+        formatted_lines, _ = linter.format_lines(lines)
+        formatted = "".join(formatted_lines)
 
-            # Should wrap with backslashes
-            assert "\\" in formatted or "depends on" in formatted
-        finally:
-            temp_path.unlink()
+        # Should wrap with backslashes
+        assert "\\" in formatted or "depends on" in formatted
 
-    def test_wrap_continuation_odd_parts(self):
+    def test_wrap_continuation_odd_parts(self, zephyr_config):
         """Test wrapping with odd number of parts."""
-        config = LinterConfig.zephyr_preset()
-        config.max_line_length = 40
-        linter = KconfigLinter(config)
+        linter = KconfigLinter(replace(zephyr_config, max_line_length=40))
 
         lines = [
             "config TEST\n",
@@ -2474,24 +1688,13 @@ class TestAdditionalCoverage:
             "\tdepends on A && B\n",  # Just enough to wrap
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
-
-        try:
-            formatted_lines, _ = linter.format_file(temp_path)
-            # Should handle gracefully
-            assert formatted_lines is not None
-        finally:
-            temp_path.unlink()
+        formatted_lines, _ = linter.format_lines(lines)
+        # Should handle gracefully
+        assert formatted_lines is not None
 
-    def test_reflow_empty_paragraph_preservation(self):
+    def test_reflow_empty_paragraph_preservation(self, zephyr_config):
         """Test that empty paragraphs are preserved during reflow."""
-        config = LinterConfig.zephyr_preset()
-        config.reflow_help_text = True
-        linter = KconfigLinter(config)
+        linter = KconfigLinter(replace(zephyr_config, reflow_help_text=True))
 
         lines = [
             "config TEST\n",
@@ -2503,103 +1706,48 @@ class TestAdditionalCoverage:
             "\t  Para 2.\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
+        formatted_lines, _ = linter.format_lines(lines)
+        formatted = "".join(formatted_lines)
 
-        try:
-            formatted_lines, _ = linter.format_file(temp_path)
-            formatted = "".join(formatted_lines)
-
-            # Should have empty lines
-            assert "\n\n" in formatted
-        finally:
-            temp_path.unlink()
+        # Should have empty lines
+        assert "\n\n" in formatted
 
-    def test_write_mode_file_error(self):
+    def test_write_mode_file_error(self, tmp_path, cli_runner):
         """Test write mode with file write error."""
         import os
 
-        config = LinterConfig.zephyr_preset()
-        _ = KconfigLinter(config)
-
         # Create a temporary file
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.write("config TEST\n")
-            f.write('\tbool "Test"\n')
-            temp_path = Path(f.name)
+        temp_path = tmp_path / "Kconfig"
+        temp_path.write_bytes(SNIPPET_NOINDENT)
 
-        try:
-            # Make file read-only to cause write error
-            os.chmod(temp_path, 0o444)
-
-            # Try to format with write mode (will fail to write)
-            try:
-                import sys
-
-                from kconfigstyle.__main__ import main
-
-                old_argv = sys.argv
-                sys.argv = ["kconfigstyle", "--write", str(temp_path)]
-
-                # Capture output
-                from io import StringIO
-
-                old_stderr = sys.stderr
-                sys.stderr = StringIO()
-
-                try:
-                    main()
-                except SystemExit:
-                    pass
-                finally:
-                    sys.stderr = old_stderr
-                    sys.argv = old_argv
-            except Exception:
-                pass  # Expected to fail
+        # Make file read-only to cause write error
+        os.chmod(temp_path, 0o444)
 
+        try:
+            # Write errors are reported on stderr without failing the run
+            result = cli_runner(["--write", temp_path])
+            assert result.returncode == 0
+        finally:
             # Restore permissions for cleanup
             os.chmod(temp_path, 0o644)
-        finally:
-            if temp_path.exists():
-                os.chmod(temp_path, 0o644)
-                temp_path.unlink()
 
-    def test_other_line_type_indentation(self):
+    def test_other_line_type_indentation(self, zephyr_linter):
         """Test indentation of 'other' line types in config block."""
-        config = LinterConfig.zephyr_preset()
-        linter = KconfigLinter(config)
-
         lines = [
             "config TEST\n",
             '\tbool "Test"\n',
             "\tmodules\n",  # 'other' type line
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
+        formatted_lines, _ = zephyr_linter.format_lines(lines)
+        formatted = "".join(formatted_lines)
 
-        try:
-            formatted_lines, _ = linter.format_file(temp_path)
-            formatted = "".join(formatted_lines)
-
-            # modules should be indented
-            assert "\tmodules\n" in formatted
-        finally:
-            temp_path.unlink()
+        # modules should be indented
+        assert "\tmodules\n" in formatted
 
-    def test_help_text_tabs_hierarchical_no_indent_sub_items(self):
+    def test_help_text_tabs_hierarchical_no_indent_sub_items(self, zephyr_config):
         """Test help text with tabs when indent_sub_items is False but we're in a nested context."""
-        config = LinterConfig.zephyr_preset()
-        config.indent_sub_items = False
-        linter = KconfigLinter(config)
+        linter = KconfigLinter(replace(zephyr_config, indent_sub_items=False))
 
         lines = [
             'menu "Test"\n',
@@ -2612,27 +1760,16 @@ class TestAdditionalCoverage:
             "endmenu\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
-
-        try:
-            formatted_lines, _ = linter.format_file(temp_path)
-            formatted = "".join(formatted_lines)
+        formatted_lines, _ = linter.format_lines(lines)
+        formatted = "".join(formatted_lines)
 
-            # Help text should maintain proper indentation
-            assert "\t  Help text.\n" in formatted
-            assert "\t  More help.\n" in formatted
-        finally:
-            temp_path.unlink()
+        # Help text should maintain proper indentation
+        assert "\t  Help text.\n" in formatted
+        assert "\t  More help.\n" in formatted
 
-    def test_help_blank_line_non_matching_indent_no_reflow(self):
+    def test_help_blank_line_non_matching_indent_no_reflow(self, zephyr_config):
         """Test help block ending with non-matching indent and no reflow."""
-        config = LinterConfig.zephyr_preset()
-        config.reflow_help_text = False
-        linter = KconfigLinter(config)
+        linter = KconfigLinter(replace(zephyr_config, reflow_help_text=False))
 
         lines = [
             "config TEST\n",
@@ -2643,26 +1780,15 @@ class TestAdditionalCoverage:
             "other_line\n",  # No help indent
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
-
-        try:
-            formatted_lines, _ = linter.format_file(temp_path)
-            formatted = "".join(formatted_lines)
+        formatted_lines, _ = linter.format_lines(lines)
+        formatted = "".join(formatted_lines)
 
-            # other_line should be at top level
-            assert "\nother_line\n" in formatted
-        finally:
-            temp_path.unlink()
+        # other_line should be at top level
+        assert "\nother_line\n" in formatted
 
-    def test_reflow_with_only_empty_lines(self):
+    def test_reflow_with_only_empty_lines(self, zephyr_config):
         """Test reflow with help text that's only empty lines."""
-        config = LinterConfig.zephyr_preset()
-        config.reflow_help_text = True
-        linter = KconfigLinter(config)
+        linter = KconfigLinter(replace(zephyr_config, reflow_help_text=True))
 
         lines = [
             "config TEST\n",
@@ -2673,26 +1799,15 @@ class TestAdditionalCoverage:
             "config NEXT\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
-
-        try:
-            formatted_lines, _ = linter.format_file(temp_path)
-            formatted = "".join(formatted_lines)
+        formatted_lines, _ = linter.format_lines(lines)
+        formatted = "".join(formatted_lines)
 
-            # Should handle gracefully
-            assert "config NEXT" in formatted
-        finally:
-            temp_path.unlink()
+        # Should handle gracefully
+        assert "config NEXT" in formatted
 
-    def test_continuation_with_final_part(self):
+    def test_continuation_with_final_part(self, zephyr_config):
         """Test continuation line wrapping reaching final part."""
-        config = LinterConfig.zephyr_preset()
-        config.max_line_length = 35
-        linter = KconfigLinter(config)
+        linter = KconfigLinter(replace(zephyr_config, max_line_length=35))
 
         lines = [
             "config TEST\n",
@@ -2700,26 +1815,15 @@ class TestAdditionalCoverage:
             "\tdepends on A && B && C && D\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
+        formatted_lines, _ = linter.format_lines(lines)
+        formatted = "".join(formatted_lines)
 
-        try:
-            formatted_lines, _ = linter.format_file(temp_path)
-            formatted = "".join(formatted_lines)
-
-            # Should wrap properly
-            assert "depends on" in formatted
-        finally:
-            temp_path.unlink()
+        # Should wrap properly
+        assert "depends on" in formatted
 
-    def test_help_ending_not_option_or_help(self):
+    def test_help_ending_not_option_or_help(self, espidf_config):
         """Test help block ending with line that's not option or help."""
-        config = LinterConfig.espidf_preset()
-        config.indent_sub_items = True
-        linter = KconfigLinter(config)
+        linter = KconfigLinter(replace(espidf_config, indent_sub_items=True))
 
         lines = [
             'menu "Test"\n',
@@ -2731,20 +1835,11 @@ class TestAdditionalCoverage:
             "    menu subthingie\n",  # Not option/help, ends config block
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
-
-        try:
-            formatted_lines, _ = linter.format_file(temp_path)
-            formatted = "".join(formatted_lines)
+        formatted_lines, _ = linter.format_lines(lines)
+        formatted = "".join(formatted_lines)
 
-            # menu should be at proper level
-            assert "menu" in formatted
-        finally:
-            temp_path.unlink()
+        # menu should be at proper level
+        assert "menu" in formatted
 
     def test_version_fallback(self):
         """Test that version fallback works."""
@@ -2754,11 +1849,8 @@ class TestAdditionalCoverage:
         assert __version__ is not None
         assert isinstance(__version__, str)
 
-    def test_lint_basic_indentation_help_with_spaces(self):
+    def test_lint_basic_indentation_help_with_spaces(self, tmp_path, espidf_linter):
         """Test linting basic indentation in help mode with spaces."""
-        config = LinterConfig.espidf_preset()
-        linter = KconfigLinter(config)
-
         lines = [
             "config TEST\n",
             '    bool "Test"\n',
@@ -2766,24 +1858,15 @@ class TestAdditionalCoverage:
             "        Help text.\n",  # Correct indent
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
+        temp_path = tmp_path / "Kconfig"
+        temp_path.write_text("".join(lines))
 
-        try:
-            issues = linter.lint_file(temp_path)
-            # Should have no issues
-            assert len(issues) == 0
-        finally:
-            temp_path.unlink()
+        issues = espidf_linter.lint_file(temp_path)
+        # Should have no issues
+        assert len(issues) == 0
 
-    def test_write_mode_with_unfixable_issues(self):
+    def test_write_mode_with_unfixable_issues(self, tmp_path, zephyr_linter):
         """Test write mode reporting unfixable issues."""
-        config = LinterConfig.zephyr_preset()
-        linter = KconfigLinter(config)
-
         # Create file with line that's too long (unfixable)
         long_line = "# " + "x" * 150 + "\n"
         lines = [
@@ -2792,67 +1875,30 @@ class TestAdditionalCoverage:
             long_line,
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
+        temp_path = tmp_path / "Kconfig"
+        temp_path.write_text("".join(lines))
 
-        try:
-            # Lint the file to get issues
-            issues = linter.lint_file(temp_path)
+        # Lint the file to get issues
+        issues = zephyr_linter.lint_file(temp_path)
 
-            # Should have issue about line length
-            assert len(issues) > 0
-            assert any("exceeds" in issue.message for issue in issues)
-        finally:
-            temp_path.unlink()
+        # Should have issue about line length
+        assert len(issues) > 0
+        assert any("exceeds" in issue.message for issue in issues)
 
-    def test_default_preset(self):
+    def test_default_preset(self, kconfig_space_indent_file, cli_runner):
         """Test that default preset is Zephyr."""
-        import sys
-
-        from kconfigstyle.__main__ import main
-
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.write("config TEST\n")
-            f.write('  bool "Test"\n')  # Wrong indent for Zephyr
-            temp_path = Path(f.name)
-
-        try:
-            old_argv = sys.argv
-            sys.argv = ["kconfigstyle", str(temp_path)]
+        result = cli_runner([kconfig_space_indent_file])
 
-            from io import StringIO
-
-            old_stdout = sys.stdout
-            sys.stdout = StringIO()
-
-            try:
-                main()
-            except SystemExit:
-                pass
-            finally:
-                _ = sys.stdout.getvalue()
-                sys.stdout = old_stdout
-                sys.argv = old_argv
-
-            # Should report issues (spaces instead of tabs)
-            # The test validates the default preset works
-        finally:
-            temp_path.unlink()
+        # Should report issues (spaces instead of tabs)
+        assert result.returncode == 1
+        assert "Use tabs for indentation" in result.stdout
 
 
 class TestCoverageImprovements:
     """Additional tests to improve code coverage."""
 
-    def test_choice_block_with_name(self):
+    def test_choice_block_with_name(self, zephyr_linter):
         """Test parsing and formatting choice block with name."""
-        config = LinterConfig.zephyr_preset()
-        linter = KconfigLinter(config)
-
         lines = [
             "choice MY_CHOICE\n",
             '\tprompt "Select option"\n',
@@ -2863,25 +1909,13 @@ class TestCoverageImprovements:
             "endchoice\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
-
-        try:
-            formatted, _ = linter.format_file(temp_path)
-            # Should preserve choice structure
-            assert any("choice" in line for line in formatted)
-            assert any("endchoice" in line for line in formatted)
-        finally:
-            temp_path.unlink()
+        formatted, _ = zephyr_linter.format_lines(lines)
+        # Should preserve choice structure
+        assert any("choice" in line for line in formatted)
+        assert any("endchoice" in line for line in formatted)
 
-    def test_choice_block_empty_lines(self):
+    def test_choice_block_empty_lines(self, zephyr_linter):
         """Test choice block with empty lines."""
-        config = LinterConfig.zephyr_preset()
-        linter = KconfigLinter(config)
-
         lines = [
             "choice\n",
             "\n",
@@ -2891,23 +1925,11 @@ class TestCoverageImprovements:
             "endchoice\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
-
-        try:
-            formatted, _ = linter.format_file(temp_path)
-            assert any("choice" in line for line in formatted)
-        finally:
-            temp_path.unlink()
+        formatted, _ = zephyr_linter.format_lines(lines)
+        assert any("choice" in line for line in formatted)
 
-    def test_source_variants(self):
+    def test_source_variants(self, zephyr_linter):
         """Test different source statement types."""
-        config = LinterConfig.zephyr_preset()
-        linter = KconfigLinter(config)
-
         lines = [
             'source "Kconfig.test"\n',
             'rsource "drivers/Kconfig"\n',
@@ -2915,49 +1937,25 @@ class TestCoverageImprovements:
             'orsource "optional2.Kconfig"\n',
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
-
-        try:
-            formatted, _ = linter.format_file(temp_path)
-            assert any("source" in line for line in formatted)
-            assert any("rsource" in line for line in formatted)
-            assert any("osource" in line for line in formatted)
-            assert any("orsource" in line for line in formatted)
-        finally:
-            temp_path.unlink()
+        formatted, _ = zephyr_linter.format_lines(lines)
+        assert any("source" in line for line in formatted)
+        assert any("rsource" in line for line in formatted)
+        assert any("osource" in line for line in formatted)
+        assert any("orsource" in line for line in formatted)
 
-    def test_comment_statement(self):
+    def test_comment_statement(self, zephyr_linter):
         """Test comment statement (not comment line)."""
-        config = LinterConfig.zephyr_preset()
-        linter = KconfigLinter(config)
-
         lines = [
             'comment "This is a comment statement"\n',
             "\tdepends on FOO\n",
             'comment "Another comment"\n',
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
-
-        try:
-            formatted, _ = linter.format_file(temp_path)
-            assert any("comment" in line and '"' in line for line in formatted)
-        finally:
-            temp_path.unlink()
+        formatted, _ = zephyr_linter.format_lines(lines)
+        assert any("comment" in line and '"' in line for line in formatted)
 
-    def test_choice_with_options(self):
+    def test_choice_with_options(self, zephyr_linter):
         """Test choice block with options like bool, tristate."""
-        config = LinterConfig.zephyr_preset()
-        linter = KconfigLinter(config)
-
         lines = [
             "choice\n",
             '\tbool "Choose one"\n',
@@ -2967,23 +1965,11 @@ class TestCoverageImprovements:
             "endchoice\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
-
-        try:
-            formatted, _ = linter.format_file(temp_path)
-            assert any("choice" in line for line in formatted)
-        finally:
-            temp_path.unlink()
+        formatted, _ = zephyr_linter.format_lines(lines)
+        assert any("choice" in line for line in formatted)
 
-    def test_menu_with_depends(self):
+    def test_menu_with_depends(self, zephyr_linter):
         """Test menu with depends statements."""
-        config = LinterConfig.zephyr_preset()
-        linter = KconfigLinter(config)
-
         lines = [
             'menu "Advanced"\n',
             "\tdepends on EXPERT\n",
@@ -2993,24 +1979,13 @@ class TestCoverageImprovements:
             "endmenu\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
-
-        try:
-            formatted, _ = linter.format_file(temp_path)
-            assert any("menu" in line for line in formatted)
-            assert any("depends" in line for line in formatted)
-        finally:
-            temp_path.unlink()
+        formatted, _ = zephyr_linter.format_lines(lines)
+        assert any("menu" in line for line in formatted)
+        assert any("depends" in line for line in formatted)
 
-    def test_line_wrapping_with_or_operator(self):
+    def test_line_wrapping_with_or_operator(self, zephyr_config):
         """Test line wrapping with || operator."""
-        config = LinterConfig.zephyr_preset()
-        config.max_line_length = 40
-        linter = KconfigLinter(config)
+        linter = KconfigLinter(replace(zephyr_config, max_line_length=40))
 
         lines = [
             "config TEST\n",
@@ -3018,48 +1993,25 @@ class TestCoverageImprovements:
             "\tdepends on FOO || BAR || BAZ || QUX || VERY_LONG\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
+        formatted, _ = linter.format_lines(lines)
+        # Should have continuation lines
+        assert any("\\" in line for line in formatted)
 
-        try:
-            formatted, _ = linter.format_file(temp_path)
-            # Should have continuation lines
-            assert any("\\" in line for line in formatted)
-        finally:
-            temp_path.unlink()
-
-    def test_wrap_line_without_operators(self):
+    def test_wrap_line_without_operators(self, zephyr_config):
         """Test that lines without && or || aren't wrapped."""
-        config = LinterConfig.zephyr_preset()
-        config.max_line_length = 30
-        linter = KconfigLinter(config)
+        linter = KconfigLinter(replace(zephyr_config, max_line_length=30))
 
         lines = [
             "config VERY_LONG_CONFIG_NAME_WITHOUT_OPERATORS\n",
             '\tbool "Test"\n',
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
-
-        try:
-            formatted, _ = linter.format_file(temp_path)
-            # Long line without operators shouldn't get backslash
-            assert not any("\\" in line for line in formatted)
-        finally:
-            temp_path.unlink()
+        formatted, _ = linter.format_lines(lines)
+        # Long line without operators shouldn't get backslash
+        assert not any("\\" in line for line in formatted)
 
-    def test_config_option_with_condition(self):
+    def test_config_option_with_condition(self, zephyr_linter):
         """Test config option with if condition."""
-        config = LinterConfig.zephyr_preset()
-        linter = KconfigLinter(config)
-
         lines = [
             "config TEST\n",
             '\tbool "Test"\n',
@@ -3067,23 +2019,11 @@ class TestCoverageImprovements:
             '\tstring "Path" if DEBUG\n',
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
-
-        try:
-            formatted, _ = linter.format_file(temp_path)
-            assert any("if" in line and "default" in line for line in formatted)
-        finally:
-            temp_path.unlink()
+        formatted, _ = zephyr_linter.format_lines(lines)
+        assert any("if" in line and "default" in line for line in formatted)
 
-    def test_def_bool_and_def_tristate(self):
+    def test_def_bool_and_def_tristate(self, zephyr_linter):
         """Test def_bool and def_tristate options."""
-        config = LinterConfig.zephyr_preset()
-        linter = KconfigLinter(config)
-
         lines = [
             "config TEST1\n",
             "\tdef_bool y\n",
@@ -3095,118 +2035,56 @@ class TestCoverageImprovements:
             "\t\tTEST3 config\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
-
-        try:
-            formatted, _ = linter.format_file(temp_path)
-            assert any("def_bool" in line for line in formatted)
-            assert any(
-                "def_tristate" in line for line in formatted
-            )
-        finally:
-            temp_path.unlink()
+        formatted, _ = zephyr_linter.format_lines(lines)
+        assert any("def_bool" in line for line in formatted)
+        assert any("def_tristate" in line for line in formatted)
 
-    def test_imply_option(self):
+    def test_imply_option(self, zephyr_linter):
         """Test imply option."""
-        config = LinterConfig.zephyr_preset()
-        linter = KconfigLinter(config)
-
         lines = [
             "config TEST\n",
             '\tbool "Test"\n',
             "\timply OTHER_OPTION\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
+        formatted, _ = zephyr_linter.format_lines(lines)
+        assert any("imply" in line for line in formatted)
 
-        try:
-            formatted, _ = linter.format_file(temp_path)
-            assert any("imply" in line for line in formatted)
-        finally:
-            temp_path.unlink()
-
-    def test_range_option(self):
+    def test_range_option(self, zephyr_linter):
         """Test range option."""
-        config = LinterConfig.zephyr_preset()
-        linter = KconfigLinter(config)
-
         lines = [
             "config NUM\n",
             "\tint\n",
             "\trange 1 100\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
+        formatted, _ = zephyr_linter.format_lines(lines)
+        assert any("range" in line for line in formatted)
 
-        try:
-            formatted, _ = linter.format_file(temp_path)
-            assert any("range" in line for line in formatted)
-        finally:
-            temp_path.unlink()
-
-    def test_option_keyword(self):
+    def test_option_keyword(self, zephyr_linter):
         """Test option keyword."""
-        config = LinterConfig.zephyr_preset()
-        linter = KconfigLinter(config)
-
         lines = [
             "config TEST\n",
             '\tbool "Test"\n',
             '\toption env="TEST_VAR"\n',
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
+        formatted, _ = zephyr_linter.format_lines(lines)
+        assert any("option" in line for line in formatted)
 
-        try:
-            formatted, _ = linter.format_file(temp_path)
-            assert any("option" in line for line in formatted)
-        finally:
-            temp_path.unlink()
-
-    def test_prompt_option(self):
+    def test_prompt_option(self, zephyr_linter):
         """Test prompt option."""
-        config = LinterConfig.zephyr_preset()
-        linter = KconfigLinter(config)
-
         lines = [
             "config TEST\n",
             "\tbool\n",
             '\tprompt "Enter value"\n',
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
+        formatted, _ = zephyr_linter.format_lines(lines)
+        assert any("prompt" in line for line in formatted)
 
-        try:
-            formatted, _ = linter.format_file(temp_path)
-            assert any("prompt" in line for line in formatted)
-        finally:
-            temp_path.unlink()
-
-    def test_hex_and_int_types(self):
+    def test_hex_and_int_types(self, zephyr_linter):
         """Test hex and int config types."""
-        config = LinterConfig.zephyr_preset()
-        linter = KconfigLinter(config)
-
         lines = [
             "config HEX_VAL\n",
             '\thex "Hex value"\n',
@@ -3214,24 +2092,12 @@ class TestCoverageImprovements:
             '\tint "Int value"\n',
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
+        formatted, _ = zephyr_linter.format_lines(lines)
+        assert any("hex" in line for line in formatted)
+        assert any("int" in line for line in formatted)
 
-        try:
-            formatted, _ = linter.format_file(temp_path)
-            assert any("hex" in line for line in formatted)
-            assert any("int" in line for line in formatted)
-        finally:
-            temp_path.unlink()
-
-    def test_help_with_no_content(self):
+    def test_help_with_no_content(self, zephyr_linter):
         """Test help block with no actual help text."""
-        config = LinterConfig.zephyr_preset()
-        linter = KconfigLinter(config)
-
         lines = [
             "config TEST\n",
             '\tbool "Test"\n',
@@ -3239,24 +2105,12 @@ class TestCoverageImprovements:
             "config NEXT\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
+        formatted, _ = zephyr_linter.format_lines(lines)
+        # Should handle gracefully
+        assert any("help" in line for line in formatted)
 
-        try:
-            formatted, _ = linter.format_file(temp_path)
-            # Should handle gracefully
-            assert any("help" in line for line in formatted)
-        finally:
-            temp_path.unlink()
-
-    def test_config_with_trailing_empty_lines(self):
+    def test_config_with_trailing_empty_lines(self, zephyr_linter):
         """Test config block ending with empty lines at EOF."""
-        config = LinterConfig.zephyr_preset()
-        linter = KconfigLinter(config)
-
         lines = [
             "config TEST\n",
             '\tbool "Test"\n',
@@ -3265,45 +2119,21 @@ class TestCoverageImprovements:
             "\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
+        formatted, _ = zephyr_linter.format_lines(lines)
+        # Should handle gracefully
+        assert any("config TEST" in line for line in formatted)
 
-        try:
-            formatted, _ = linter.format_file(temp_path)
-            # Should handle gracefully
-            assert any("config TEST" in line for line in formatted)
-        finally:
-            temp_path.unlink()
-
-    def test_source_without_quotes(self):
+    def test_source_without_quotes(self, zephyr_linter):
         """Test source statement without quotes."""
-        config = LinterConfig.zephyr_preset()
-        linter = KconfigLinter(config)
-
         lines = [
             "source Kconfig.test\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
+        formatted, _ = zephyr_linter.format_lines(lines)
+        assert any("source" in line for line in formatted)
 
-        try:
-            formatted, _ = linter.format_file(temp_path)
-            assert any("source" in line for line in formatted)
-        finally:
-            temp_path.unlink()
-
-    def test_if_block_hierarchical(self):
+    def test_if_block_hierarchical(self, espidf_linter):
         """Test if block with hierarchical indentation."""
-        config = LinterConfig.espidf_preset()
-        linter = KconfigLinter(config)
-
         lines = [
             "if FOO\n",
             "config TEST\n",
@@ -3311,93 +2141,45 @@ class TestCoverageImprovements:
             "endif\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
+        formatted, _ = espidf_linter.format_lines(lines)
+        # Should indent content inside if block
+        assert any("    config" in line or "config" in line for line in formatted)
 
-        try:
-            formatted, _ = linter.format_file(temp_path)
-            # Should indent content inside if block
-            assert any("    config" in line or "config" in line for line in formatted)
-        finally:
-            temp_path.unlink()
-
-    def test_unknown_config_option(self):
+    def test_unknown_config_option(self, zephyr_linter):
         """Test unknown/unrecognized config option."""
-        config = LinterConfig.zephyr_preset()
-        linter = KconfigLinter(config)
-
         lines = [
             "config TEST\n",
             '\tbool "Test"\n',
             "\tunknown_option value\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
+        formatted, _ = zephyr_linter.format_lines(lines)
+        # Should preserve unknown options
+        assert len(formatted) > 0
 
-        try:
-            formatted, _ = linter.format_file(temp_path)
-            # Should preserve unknown options
-            assert len(formatted) > 0
-        finally:
-            temp_path.unlink()
-
-    def test_string_type(self):
+    def test_string_type(self, zephyr_linter):
         """Test string config type."""
-        config = LinterConfig.zephyr_preset()
-        linter = KconfigLinter(config)
-
         lines = [
             "config PATH\n",
             '\tstring "Enter path"\n',
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
+        formatted, _ = zephyr_linter.format_lines(lines)
+        assert any("string" in line for line in formatted)
 
-        try:
-            formatted, _ = linter.format_file(temp_path)
-            assert any("string" in line for line in formatted)
-        finally:
-            temp_path.unlink()
-
-    def test_type_without_prompt(self):
+    def test_type_without_prompt(self, zephyr_linter):
         """Test type declaration without prompt."""
-        config = LinterConfig.zephyr_preset()
-        linter = KconfigLinter(config)
-
         lines = [
             "config TEST\n",
             "\tbool\n",
             '\tprompt "Test"\n',
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
+        formatted, _ = zephyr_linter.format_lines(lines)
+        assert any("bool" in line for line in formatted)
 
-        try:
-            formatted, _ = linter.format_file(temp_path)
-            assert any("bool" in line for line in formatted)
-        finally:
-            temp_path.unlink()
-
-    def test_complex_nesting_choice_if_menuconfig(self):
+    def test_complex_nesting_choice_if_menuconfig(self, zephyr_linter):
         """Test complex nesting with choice, if blocks, and menuconfig."""
-        config = LinterConfig.zephyr_preset()
-        linter = KconfigLinter(config)
-
         lines = [
             "choice BUILD_TYPE\n",
             '\tprompt "Build type"\n',
@@ -3433,30 +2215,21 @@ class TestCoverageImprovements:
             "endchoice\n",
         ]
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".Kconfig", delete=False
-        ) as f:
-            f.writelines(lines)
-            temp_path = Path(f.name)
+        formatted, _ = zephyr_linter.format_lines(lines)
+        formatted_text = "".join(formatted)
 
-        try:
-            formatted, _ = linter.format_file(temp_path)
-            formatted_text = "".join(formatted)
-
-            # Verify structure is preserved
-            assert "choice BUILD_TYPE" in formatted_text
-            assert "config USE_TYPE_A" in formatted_text
-            assert "menuconfig USE_TYPE_B" in formatted_text
-            assert "if USE_TYPE_B" in formatted_text
-            assert "choice TYPE_B_VARIANT" in formatted_text
-            assert "config VARIANT_1" in formatted_text
-            assert "config VARIANT_2" in formatted_text
-
-            # Verify proper closing
-            assert formatted_text.count("endchoice") == 2
-            assert formatted_text.count("endif") == 1
-
-            # Verify no duplicate or missing blank lines around nested structures
-            assert "\n\n\n" not in formatted_text
-        finally:
-            temp_path.unlink()
+        # Verify structure is preserved
+        assert "choice BUILD_TYPE" in formatted_text
+        assert "config USE_TYPE_A" in formatted_text
+        assert "menuconfig USE_TYPE_B" in formatted_text
+        assert "if USE_TYPE_B" in formatted_text
+        assert "choice TYPE_B_VARIANT" in formatted_text
+        assert "config VARIANT_1" in formatted_text
+        assert "config VARIANT_2" in formatted_text
+
+        # Verify proper closing
+        assert formatted_text.count("endchoice") == 2
+        assert formatted_text.count("endif") == 1
+
+        # Verify no duplicate or missing blank lines around nested structures
+        assert "\n\n\n" not in formatted_text